@@ -9,7 +9,13 @@ import sys
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .helpers import async_set_ha, clear_ha, get_ha, handle_log_level
+from .helpers import (
+    async_set_ha,
+    clear_ha,
+    get_ha,
+    get_storage_manager,
+    handle_log_level,
+)
 from .helpers.const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,6 +60,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove data stored for a deleted config entry."""
+    storage_manager = get_storage_manager(hass)
+
+    await storage_manager.async_remove_snapshot(entry.entry_id)
+
+
 async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry):
     """Triggered by config entry options updates."""
     await handle_log_level(hass, entry)
@@ -1,9 +1,9 @@
 from datetime import datetime
 import hashlib
-import json
 import logging
 import sys
 import asyncio
+import time
 from typing import Optional
 
 import aiohttp
@@ -11,16 +11,26 @@ from aiohttp import ClientSession, ClientTimeout
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
+from ..helpers.const import (
+    BULK_COMMAND_CONCURRENCY,
+    CIRCUIT_BREAKER_CLOSED,
+    CONTROL_REQUEST_TIMEOUT,
+)
 from ..managers.configuration_manager import ConfigManager
 from ..models.camera_data import CameraData
+from ..models.snapshot_data import SnapshotData
+from .circuit_breaker import CircuitBreaker, get_backoff_delay
+from .connection_pool import ConnectionPool
+from .serializer import json_dumps, json_loads
 
 REQUIREMENTS = ["aiohttp"]
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_TIMEOUT = ClientTimeout(total=10)
+DEFAULT_TIMEOUT = ClientTimeout(total=CONTROL_REQUEST_TIMEOUT)
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
+RETRY_MAX_DELAY = 4  # seconds
 
 
 class BlueIrisApi:
@@ -28,22 +38,47 @@ class BlueIrisApi:
 
     is_logged_in: bool
     session_id: Optional[str]
+    session_started: Optional[float]
     session: Optional[ClientSession]
     data: dict
     status: dict
     camera_list: list[CameraData]
+    command_timing: dict[str, float]
     hass: HomeAssistant
     config_manager: ConfigManager
+    connection_pool: Optional[ConnectionPool]
+    circuit_breaker: CircuitBreaker
     base_url: str
     url: str
 
-    def __init__(self, hass: HomeAssistant, config_manager: ConfigManager):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_manager: ConfigManager,
+        connection_pool: Optional[ConnectionPool] = None,
+    ):
         try:
             self._last_update = datetime.now()
             self.hass = hass
             self.config_manager = config_manager
+            self.connection_pool = connection_pool
+            self.circuit_breaker = CircuitBreaker()
             self.session_id = None
+            self.session_started = None
+            self.is_logged_in = False
+            self.data = {}
+            self.status = {}
+            self.camera_list = []
             self.session = None
+            self.command_timing = {}
+            self.session_metrics = {
+                "logins": 0,
+                "shared_logins": 0,
+                "auth_failures": 0,
+                "transport_failures": 0,
+            }
+
+            self._login_task: Optional[asyncio.Task] = None
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             _LOGGER.error(f"Failed to load BlueIris API, error: {ex}, line: {tb.tb_lineno}")
@@ -56,63 +91,176 @@ class BlueIrisApi:
     def config_data(self):
         return self.config_manager.data
 
+    @property
+    def session_age(self) -> Optional[float]:
+        if self.session_started is None:
+            return None
+
+        return time.monotonic() - self.session_started
+
     async def ensure_session(self):
-        if self.session is None or self.session.closed:
+        if self.connection_pool is not None:
+            # Pool may replace its sessions, e.g. when connection limit changes
+            self.session = self.connection_pool.control_session
+
+        elif self.session is None or self.session.closed:
             if self.hass is None:
                 self.session = aiohttp.ClientSession(timeout=DEFAULT_TIMEOUT)
             else:
                 self.session = async_create_clientsession(hass=self.hass, timeout=DEFAULT_TIMEOUT)
 
     async def async_close(self):
-        if self.session and not self.session.closed:
+        if self._login_task is not None and not self._login_task.done():
+            # Would otherwise keep running against a closed session
+            self._login_task.cancel()
+
+            try:
+                await self._login_task
+            except asyncio.CancelledError:
+                _LOGGER.debug(f"Login to {self.base_url} cancelled")
+
+        self._login_task = None
+
+        if self.connection_pool is not None:
+            # Session belongs to the pool, it will be closed with it
+            self.session = None
+
+        elif self.session and not self.session.closed:
             await self.session.close()
 
+    def _set_command_timing(self, command, started):
+        duration = time.monotonic() - started
+
+        self.command_timing[command] = duration
+
+        _LOGGER.debug(f"Command {command} took {duration:.3f} seconds")
+
     async def async_post(self, data):
         await self.ensure_session()
         result = None
+        started = time.monotonic()
 
         for attempt in range(MAX_RETRIES):
+            if not self.circuit_breaker.allow_request():
+                _LOGGER.debug(f"Skip POST to {self.url}, circuit is {self.circuit_breaker.state}")
+                break
+
+            is_probe = self.circuit_breaker.is_probing
+            is_retriable = not is_probe
+
             try:
-                async with self.session.post(self.url, data=json.dumps(data), ssl=False) as response:
+                async with self.session.post(self.url, data=json_dumps(data), ssl=False) as response:
                     _LOGGER.debug(f"Status of {self.url}: {response.status}")
                     response.raise_for_status()
-                    result = await response.json()
+                    result = json_loads(await response.read())
                     _LOGGER.debug(f"Full result of {data}: {result}")
                     self._last_update = datetime.now()
+                    self._set_command_timing(data.get("cmd"), started)
+                    self.circuit_breaker.record_success()
                     return result
-            except aiohttp.ClientError as ex:
+            except asyncio.CancelledError:
+                if is_probe:
+                    self.circuit_breaker.release_probe()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
                 _LOGGER.warning(f"Attempt {attempt+1} failed: {ex}")
-                await asyncio.sleep(RETRY_DELAY)
             except Exception as ex:
                 exc_type, exc_obj, tb = sys.exc_info()
                 _LOGGER.error(f"Unexpected error on attempt {attempt+1}, Error: {ex}, Line: {tb.tb_lineno}")
-                await asyncio.sleep(RETRY_DELAY)
+                is_retriable = False
+
+            self.circuit_breaker.record_failure(is_probe)
 
-        _LOGGER.error(f"All attempts to POST to {self.url} failed.")
+            if not is_retriable or attempt + 1 == MAX_RETRIES:
+                _LOGGER.error(f"All attempts to POST to {self.url} failed.")
+                break
+
+            await asyncio.sleep(get_backoff_delay(RETRY_DELAY, attempt, RETRY_MAX_DELAY))
+
+        self._set_command_timing(data.get("cmd"), started)
         return None
 
     async def async_verified_post(self, data):
-        for i in range(2):
-            result = await self.async_post(data)
-            if result is not None and result.get("result") != "fail":
-                return result
+        result = await self.async_post(data)
 
-            _LOGGER.warning(f"Request #{i} to BlueIris ({self.base_url}) failed, Data: {data}, Response: {result}")
-            await self.login()
+        if result is None:
+            # Transport failure, already retried, new session won't help
+            self.session_metrics["transport_failures"] += 1
 
-        return None
+            return None
+
+        if result.get("result") != "fail":
+            return result
+
+        self.session_metrics["auth_failures"] += 1
+
+        _LOGGER.warning(f"Request to BlueIris ({self.base_url}) rejected, Data: {data}, Response: {result}")
+
+        if not await self.async_relogin(data.get("session")):
+            return None
+
+        if "session" in data:
+            data = {**data, "session": self.session_id}
+
+        result = await self.async_post(data)
+
+        if result is None or result.get("result") == "fail":
+            _LOGGER.warning(f"Request to BlueIris ({self.base_url}) failed after login, Data: {data}, Response: {result}")
+
+            return None
+
+        return result
+
+    async def async_relogin(self, failed_session_id: Optional[str]) -> bool:
+        """Login again once for all callers rejected with the same session."""
+        if self._login_task is not None and not self._login_task.done():
+            self.session_metrics["shared_logins"] += 1
+
+            return await asyncio.shield(self._login_task)
+
+        if self.is_logged_in and self.session_id != failed_session_id:
+            # Another caller already replaced the session that was rejected
+            self.session_metrics["shared_logins"] += 1
+
+            return True
+
+        self.is_logged_in = False
+        self._login_task = asyncio.ensure_future(self.login())
+
+        return await asyncio.shield(self._login_task)
+
+    @property
+    def snapshot(self) -> SnapshotData:
+        snapshot = SnapshotData()
+        snapshot.data = self.data
+        snapshot.status = self.status
+        snapshot.camera_list = self.camera_list
+
+        return snapshot
+
+    def restore(self, snapshot: SnapshotData):
+        """Use last known data until the server responds, session is not restored."""
+        _LOGGER.debug(f"Restoring {len(snapshot.camera_list)} camera from snapshot")
+
+        self._set_url()
+
+        self.data = dict(snapshot.data)
+        self.status = dict(snapshot.status)
+        self.camera_list = snapshot.camera_list
+
+    def _set_url(self):
+        config_data = self.config_data
+        self.base_url = f"{config_data.protocol}://{config_data.host}:{config_data.port}"
+        self.url = f"{self.base_url}/json"
+        self.circuit_breaker.name = self.base_url
 
     async def initialize(self):
         _LOGGER.debug("Initializing BlueIris")
         try:
-            config_data = self.config_data
-            self.base_url = f"{config_data.protocol}://{config_data.host}:{config_data.port}"
-            self.url = f"{self.base_url}/json"
+            self._set_url()
 
+            # Previous data (or restored snapshot) is kept until replaced by update
             self.is_logged_in = False
-            self.data = {}
-            self.status = {}
-            self.camera_list = []
 
             await self.ensure_session()
             await self.login()
@@ -122,18 +270,43 @@ class BlueIrisApi:
 
     async def async_update(self):
         _LOGGER.debug(f"Updating data from BI Server ({self.config_manager.config_entry.title})")
-        await self.load_camera()
-        await self.load_status()
+        started = time.monotonic()
+
+        camera_request = {"cmd": "camlist", "session": self.session_id}
+        status_request = {"cmd": "status", "session": self.session_id}
+
+        if self.circuit_breaker.state == CIRCUIT_BREAKER_CLOSED:
+            # camlist and status are independent, send both and apply together
+            camera_response, status_response = await asyncio.gather(
+                self.async_verified_post(camera_request),
+                self.async_verified_post(status_request),
+            )
+        else:
+            # Only the probe passes, status is sent once camlist closed the circuit
+            camera_response = await self.async_verified_post(camera_request)
+            status_response = await self.async_verified_post(status_request)
+
+        self._set_camera_list(camera_response)
+        self._set_status(status_response)
+
+        self._set_command_timing("update", started)
+
+        is_successful = camera_response is not None and status_response is not None
+
+        return is_successful
 
     async def load_session_id(self):
         _LOGGER.debug("Retrieving session ID")
         response = await self.async_post({"cmd": "login"})
         self.session_id = response.get("session") if response else None
+        self.session_started = None
         self.is_logged_in = False
 
     async def login(self):
         _LOGGER.debug("Performing login")
         try:
+            self.session_metrics["logins"] += 1
+
             await self.load_session_id()
             if self.session_id:
                 config_data = self.config_manager.data
@@ -148,6 +321,7 @@ class BlueIrisApi:
 
                 if result and result.get("result") == "success":
                     self.is_logged_in = True
+                    self.session_started = time.monotonic()
                     self.data.update(result.get("data", {}))
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -158,12 +332,18 @@ class BlueIrisApi:
     async def load_camera(self):
         _LOGGER.debug("Retrieving camera list")
         response = await self.async_verified_post({"cmd": "camlist", "session": self.session_id})
-        if response:
-            self.camera_list = [CameraData(cam) for cam in response.get("data", [])]
+        self._set_camera_list(response)
 
     async def load_status(self):
         _LOGGER.debug("Retrieving status")
         response = await self.async_verified_post({"cmd": "status", "session": self.session_id})
+        self._set_status(response)
+
+    def _set_camera_list(self, response):
+        if response:
+            self.camera_list = [CameraData(cam) for cam in response.get("data", [])]
+
+    def _set_status(self, response):
         if response:
             self.status.update(response.get("data", {}))
 
@@ -202,19 +382,58 @@ class BlueIrisApi:
                 return
             self.status.update(data)
 
-    async def trigger_camera(self, camera_short_name):
+    async def trigger_camera(self, camera_short_name) -> bool:
         _LOGGER.debug(f"Triggering camera {camera_short_name}")
-        await self.async_verified_post({
+        response = await self.async_verified_post({
             "cmd": "trigger",
             "session": self.session_id,
             "camera": camera_short_name,
         })
 
-    async def move_to_preset(self, camera_short_name, preset):
+        return response is not None
+
+    async def move_to_preset(self, camera_short_name, preset) -> bool:
         _LOGGER.debug(f"Moving {camera_short_name} to preset {preset}")
-        await self.async_verified_post({
+        response = await self.async_verified_post({
             "cmd": "ptz",
             "session": self.session_id,
             "camera": camera_short_name,
             "button": 100 + preset,
         })
+
+        return response is not None
+
+    async def trigger_cameras(self, camera_short_names: list[str]) -> dict[str, bool]:
+        results = await self._async_bulk_command(camera_short_names, self.trigger_camera)
+
+        return results
+
+    async def move_cameras_to_preset(self, camera_short_names: list[str], preset) -> dict[str, bool]:
+        results = await self._async_bulk_command(camera_short_names, self.move_to_preset, preset)
+
+        return results
+
+    async def _async_bulk_command(self, camera_short_names, command, *args) -> dict[str, bool]:
+        """Run a camera command for all camera concurrently, returns the result per camera."""
+        semaphore = asyncio.Semaphore(BULK_COMMAND_CONCURRENCY)
+
+        async def run_command(camera_short_name):
+            async with semaphore:
+                return await command(camera_short_name, *args)
+
+        responses = await asyncio.gather(
+            *[run_command(camera_short_name) for camera_short_name in camera_short_names],
+            return_exceptions=True,
+        )
+
+        results = {}
+
+        for camera_short_name, response in zip(camera_short_names, responses):
+            if isinstance(response, Exception):
+                _LOGGER.error(f"Failed to run {command.__name__} for {camera_short_name}, Error: {response}")
+
+                response = False
+
+            results[camera_short_name] = response
+
+        return results
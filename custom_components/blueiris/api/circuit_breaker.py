@@ -0,0 +1,141 @@
+import logging
+import random
+import time
+from typing import Optional
+
+from ..helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_backoff_delay(base_delay: float, attempt: int, max_delay: float) -> float:
+    """Exponential backoff with jitter, between half and full delay of the attempt."""
+    delay = min(base_delay * (2**attempt), max_delay)
+
+    jittered_delay = delay * random.uniform(0.5, 1)
+
+    return jittered_delay
+
+
+class CircuitBreaker:
+    """Stops requests to an unreachable server, probes it with a single request."""
+
+    name: str
+    _failure_threshold: int
+    _state: str
+    _failures: int
+    _opened: int
+    _open_until: Optional[float]
+    _is_probing: bool
+
+    def __init__(
+        self,
+        name: str = DOMAIN,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    ):
+        self.name = name
+        self._failure_threshold = failure_threshold
+
+        self._state = CIRCUIT_BREAKER_CLOSED
+        self._failures = 0
+        self._opened = 0
+        self._open_until = None
+        self._is_probing = False
+
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == CIRCUIT_BREAKER_OPEN and self._get_remaining() <= 0:
+            return CIRCUIT_BREAKER_HALF_OPEN
+
+        return self._state
+
+    @property
+    def is_probing(self) -> bool:
+        return self._is_probing
+
+    @property
+    def stats(self) -> dict:
+        stats = {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self._failure_threshold,
+            "retry_in": max(self._get_remaining(), 0),
+            "rejected": self._rejected,
+        }
+
+        return stats
+
+    def allow_request(self) -> bool:
+        """Whether a request can be sent, claims the probe when half-open."""
+        state = self.state
+
+        if state == CIRCUIT_BREAKER_CLOSED:
+            return True
+
+        if state == CIRCUIT_BREAKER_HALF_OPEN and not self._is_probing:
+            _LOGGER.debug(f"Circuit of {self.name} is half-open, probing server")
+
+            self._state = CIRCUIT_BREAKER_HALF_OPEN
+            self._is_probing = True
+
+            return True
+
+        self._rejected += 1
+
+        return False
+
+    def release_probe(self):
+        """Probe ended without an outcome (cancelled), allow another one."""
+        self._is_probing = False
+
+    def record_success(self):
+        if self._state != CIRCUIT_BREAKER_CLOSED:
+            _LOGGER.info(f"Circuit of {self.name} closed, server is reachable")
+
+        self._state = CIRCUIT_BREAKER_CLOSED
+        self._failures = 0
+        self._opened = 0
+        self._open_until = None
+        self._is_probing = False
+
+    def record_failure(self, is_probe: bool = False):
+        self._failures += 1
+
+        if is_probe:
+            self._open()
+
+        elif self._state == CIRCUIT_BREAKER_CLOSED:
+            if self._failures >= self._failure_threshold:
+                self._open()
+
+        # Otherwise sent before the circuit opened, only counted
+
+    def _open(self):
+        open_duration = get_backoff_delay(
+            CIRCUIT_BREAKER_OPEN_DURATION,
+            self._opened,
+            CIRCUIT_BREAKER_MAX_OPEN_DURATION,
+        )
+
+        if self._state == CIRCUIT_BREAKER_CLOSED:
+            _LOGGER.warning(
+                f"Circuit of {self.name} opened after {self._failures} failures, "
+                f"retry in {open_duration:.1f}s"
+            )
+        else:
+            _LOGGER.debug(
+                f"Circuit of {self.name} re-opened, retry in {open_duration:.1f}s"
+            )
+
+        self._state = CIRCUIT_BREAKER_OPEN
+        self._opened += 1
+        self._open_until = time.monotonic() + open_duration
+        self._is_probing = False
+
+    def _get_remaining(self) -> float:
+        if self._open_until is None:
+            return 0
+
+        return self._open_until - time.monotonic()
@@ -0,0 +1,142 @@
+import logging
+from typing import Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+from ..helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+POOL_CONTROL = "control"
+POOL_MEDIA = "media"
+
+POOL_TIMEOUTS = {
+    POOL_CONTROL: ClientTimeout(total=CONTROL_REQUEST_TIMEOUT),
+    POOL_MEDIA: ClientTimeout(total=IMAGE_REQUEST_TIMEOUT),
+}
+
+
+class ConnectionPool:
+    """Keep-alive HTTP pools, JSON control calls and images don't compete."""
+
+    _hass: HomeAssistant
+    _limit_per_host: int
+    _sessions: dict[str, ClientSession]
+
+    def __init__(
+        self, hass: HomeAssistant, limit_per_host: int = DEFAULT_CONNECTION_LIMIT
+    ):
+        self._hass = hass
+        self._limit_per_host = limit_per_host
+        self._sessions = {}
+        self._retired_sessions = []
+
+        self._remove_close_listener = None
+
+        if hass is not None:
+            self._remove_close_listener = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_handle_close
+            )
+
+    @property
+    def control_session(self) -> ClientSession:
+        return self._get_session(POOL_CONTROL)
+
+    @property
+    def media_session(self) -> ClientSession:
+        return self._get_session(POOL_MEDIA)
+
+    @property
+    def stats(self) -> dict:
+        stats = {
+            pool_name: self._get_connector_stats(session.connector)
+            for pool_name, session in self._sessions.items()
+            if not session.closed
+        }
+
+        return stats
+
+    async def async_set_limit(self, limit_per_host: int):
+        if limit_per_host == self._limit_per_host:
+            return
+
+        _LOGGER.debug(f"Connections per host changed to {limit_per_host}")
+
+        self._limit_per_host = limit_per_host
+
+        # New sessions will be created with the new limit on next request,
+        # requests in flight (possibly of other servers) complete on the old ones
+        self._retired_sessions.extend(self._sessions.values())
+        self._sessions = {}
+
+        if self._hass is not None:
+            async_call_later(
+                self._hass, IMAGE_REQUEST_TIMEOUT, self._async_close_retired_sessions
+            )
+        else:
+            await self._async_close_retired_sessions()
+
+    async def async_close(self):
+        """Close open sessions, new ones are created on next request."""
+        await self._async_close_sessions()
+
+    async def _async_handle_close(self, _event: Event):
+        self._remove_close_listener = None
+
+        await self._async_close_sessions()
+
+    async def _async_close_sessions(self):
+        self._retired_sessions.extend(self._sessions.values())
+        self._sessions = {}
+
+        await self._async_close_retired_sessions()
+
+    async def _async_close_retired_sessions(self, _now=None):
+        sessions = self._retired_sessions
+        self._retired_sessions = []
+
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def _get_session(self, pool_name: str) -> ClientSession:
+        session: Optional[ClientSession] = self._sessions.get(pool_name)
+
+        if session is None or session.closed:
+            connector = TCPConnector(
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+
+            session = ClientSession(
+                connector=connector, timeout=POOL_TIMEOUTS[pool_name]
+            )
+
+            self._sessions[pool_name] = session
+
+        return session
+
+    def _get_connector_stats(self, connector: TCPConnector) -> dict:
+        # aiohttp doesn't expose pool usage, read the connector's bookkeeping
+        acquired = getattr(connector, "_acquired", set())
+        connections = getattr(connector, "_conns", {})
+        waiters = getattr(connector, "_waiters", {})
+
+        in_use = len(acquired)
+        idle = sum(len(items) for items in connections.values())
+
+        stats = {
+            "limit_per_host": self._limit_per_host,
+            "open": in_use + idle,
+            "in_use": in_use,
+            "idle": idle,
+            "waiting": sum(len(items) for items in waiters.values()),
+        }
+
+        return stats
@@ -0,0 +1,24 @@
+"""JSON serializer of BlueIris requests, uses orjson when available."""
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def json_loads(content: bytes) -> Any:
+        return orjson.loads(content)
+
+    SERIALIZER = "orjson"
+
+except ImportError:
+
+    def json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    def json_loads(content: bytes) -> Any:
+        return json.loads(content)
+
+    SERIALIZER = "json"
@@ -35,9 +35,9 @@ class BlueIrisAudioBinarySensor(BlueIrisBinarySensor):
         async def turn_off_automatically():
             _LOGGER.debug(f"Audio alert off | {self.name}")
 
-            self.entity_manager.set_mqtt_state(self.topic, self.event_type, False)
-
-            self.hass.async_create_task(self.ha.async_update(None))
+            await self.entity_manager.async_update_mqtt_state(
+                self.topic, self.event_type, False
+            )
 
         if is_trigger_off:
             self._last_alert = None
@@ -77,11 +77,7 @@ class BlueIrisMainBinarySensor(BinarySensorEntity, BlueIrisEntity):
 
         value = trigger == STATE_ON
 
-        self.entity_manager.set_mqtt_state(topic, event_type, value)
-
-        self.entity_manager.update()
-
-        self.hass.async_create_task(self.ha.dispatch_all())
+        self.entity_manager.queue_mqtt_state(topic, event_type, value)
 
     def _immediate_update(self, previous_state: bool):
         if previous_state != self.entity.state:
@@ -5,11 +5,13 @@ https://home-assistant.io/components/camera.blueiris/
 """
 from abc import ABC
 import asyncio
+from functools import partial
 import logging
 from typing import Optional
 
 import aiohttp
 import voluptuous as vol
+from yarl import URL
 
 from homeassistant.components.camera import (
     DOMAIN as DOMAIN_CAMERA,
@@ -20,10 +22,12 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_VERIFY_SSL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import config_validation as cv, entity_platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .helpers.const import (
     BI_CAMERA_ATTR_GROUP_CAMERAS,
+    BI_IMAGE_HEIGHT,
+    BI_IMAGE_QUALITY,
+    BI_IMAGE_WIDTH,
     CONF_CONTENT_TYPE,
     CONF_FRAMERATE,
     CONF_LIMIT_REFETCH_TO_URL_CHANGE,
@@ -31,6 +35,7 @@ from .helpers.const import (
     CONF_STREAM_SOURCE,
     CONF_SUPPORT_STREAM,
     DOMAIN,
+    IMAGE_RESIZED_QUALITY,
     NOT_AVAILABLE,
     SERVICE_MOVE_TO_PRESET,
     SERVICE_TRIGGER_CAMERA,
@@ -87,22 +92,27 @@ class BlueIrisCamera(Camera, BlueIrisEntity, ABC):
         super().__init__()
         self.hass = hass
 
+        self._set_details(device_info)
+
+        self._last_url = None
+        self._last_images = {}
+
+    def _set_details(self, device_info):
+        """URLs embed the session, they change after (re-)login."""
         stream_source = device_info.get(CONF_STREAM_SOURCE)
         stream_support = device_info.get(CONF_SUPPORT_STREAM, False)
 
-        
-
         self._still_image_url = device_info[CONF_STILL_IMAGE_URL]
-        self._still_image_url.hass = hass
+        self._still_image_url.hass = self.hass
 
         self._stream_source = device_info[CONF_STREAM_SOURCE]
         self._limit_refetch = device_info[CONF_LIMIT_REFETCH_TO_URL_CHANGE]
-        self._frame_interval = 1 / device_info[CONF_FRAMERATE]        
+        self._frame_interval = 1 / device_info[CONF_FRAMERATE]
         self.content_type = device_info[CONF_CONTENT_TYPE]
         self.verify_ssl = device_info[CONF_VERIFY_SSL]
 
         self._attr_supported_features = CameraEntityFeature(0)
-        if stream_source and stream_support:            
+        if stream_source and stream_support:
             self._attr_supported_features = CameraEntityFeature.STREAM
 
         username = device_info.get(CONF_USERNAME)
@@ -113,15 +123,14 @@ class BlueIrisCamera(Camera, BlueIrisEntity, ABC):
         else:
             self._auth = None
 
-        self._last_url = None
-        self._last_image = None
-
     def _immediate_update(self, previous_state: bool):
         if previous_state != self.entity.state:
             _LOGGER.debug(
                 f"{self.name} updated from {previous_state} to {self.entity.state}"
             )
 
+        self._set_details(self.entity.details)
+
         super()._immediate_update(previous_state)
 
     async def async_added_to_hass_local(self):
@@ -143,52 +152,123 @@ class BlueIrisCamera(Camera, BlueIrisEntity, ABC):
     ) -> Optional[bytes]:
         """Return bytes of camera image."""
         return asyncio.run_coroutine_threadsafe(
-            self.async_camera_image(), self.hass.loop
+            self.async_camera_image(width, height), self.hass.loop
         ).result()
 
     async def async_camera_image(
         self, width: Optional[int] = None, height: Optional[int] = None
     ) -> Optional[bytes]:
         """Return a still image response from the camera."""
+        # Fallback of the same size, another size would be served at the wrong resolution
+        size = (width, height)
+        last_image = self._last_images.get(size)
+
         try:
             url = self._still_image_url.async_render()
         except TemplateError as err:
             _LOGGER.error("Error parsing template %s: %s", self._still_image_url, err)
-            return self._last_image
+            return last_image
+
+        if url == self._last_url and self._limit_refetch and last_image is not None:
+            return last_image
+
+        ttl = self.ha.config_data.image_cache_ttl / 1000
+
+        image_url = self._get_image_url(url, width, height)
+        fetch_image = partial(self._async_fetch_image, image_url)
+
+        # Each requested size is cached separately
+        cache_key = (self.unique_id, width, height)
+
+        image = await self.ha.image_cache.async_get(cache_key, ttl, fetch_image)
+
+        if image is None:
+            return last_image
+
+        self._last_images[size] = image
+        self._last_url = url
+        return image
+
+    @staticmethod
+    def _get_image_url(url, width: Optional[int], height: Optional[int]) -> str:
+        """Let BlueIris scale the image to the requested size."""
+        size_params = {}
+
+        if width:
+            size_params[BI_IMAGE_WIDTH] = width
 
-        if url == self._last_url and self._limit_refetch:
-            return self._last_image
+        if height:
+            size_params[BI_IMAGE_HEIGHT] = height
 
+        if len(size_params) == 0:
+            return url
+
+        size_params[BI_IMAGE_QUALITY] = IMAGE_RESIZED_QUALITY
+
+        image_url = str(URL(url).update_query(size_params))
+
+        return image_url
+
+    async def _async_fetch_image(self, url) -> Optional[bytes]:
         try:
-            websession = async_get_clientsession(self.hass, verify_ssl=self.verify_ssl)
+            websession = self.ha.connection_pool.media_session
+
+            request_kwargs = {} if self.verify_ssl else {"ssl": False}
 
-            response = await websession.get(url, auth=self._auth, timeout=10)
+            async with websession.get(
+                url, auth=self._auth, **request_kwargs
+            ) as response:
+                # Error pages must not be cached and served as the image
+                response.raise_for_status()
 
-            self._last_image = await response.read()
+                if not response.content_type.startswith("image/"):
+                    _LOGGER.error(
+                        "Unexpected content type %s of camera image from %s",
+                        response.content_type,
+                        self.name,
+                    )
+                    return None
+
+                image = await response.read()
         except asyncio.TimeoutError:
             _LOGGER.error("Timeout getting camera image from %s", self.name)
-            return self._last_image
+            return None
         except aiohttp.ClientError as err:
             _LOGGER.error("Error getting new camera image from %s: %s", self.name, err)
-            return self._last_image
+            return None
 
-        self._last_url = url
-        return self._last_image
+        return image
 
     async def stream_source(self):
         """Return the source of the stream."""
         return self._stream_source
 
     async def trigger_camera(self):
-        if self.entity.attributes[BI_CAMERA_ATTR_GROUP_CAMERAS] == NOT_AVAILABLE:
-            await self.api.trigger_camera(self.entity.id)
-        else:
-            for grouped_camera in self.entity.attributes[BI_CAMERA_ATTR_GROUP_CAMERAS]:
-                await self.api.trigger_camera(grouped_camera)
+        results = await self.api.trigger_cameras(self._get_target_camera())
+
+        self._log_failed_commands("trigger", results)
 
     async def move_to_preset(self, preset):
-        if self.entity.attributes[BI_CAMERA_ATTR_GROUP_CAMERAS] == NOT_AVAILABLE:
-            await self.api.move_to_preset(self.entity.id, preset)
-        else:
-            for grouped_camera in self.entity.attributes[BI_CAMERA_ATTR_GROUP_CAMERAS]:
-                await self.api.move_to_preset(grouped_camera, preset)
+        results = await self.api.move_cameras_to_preset(
+            self._get_target_camera(), preset
+        )
+
+        self._log_failed_commands(f"move to preset {preset}", results)
+
+    def _get_target_camera(self) -> list[str]:
+        """Camera itself or all camera of a group."""
+        group_cameras = self.entity.attributes[BI_CAMERA_ATTR_GROUP_CAMERAS]
+
+        if group_cameras == NOT_AVAILABLE:
+            return [self.entity.id]
+
+        return group_cameras
+
+    def _log_failed_commands(self, command: str, results: dict[str, bool]):
+        failed = [camera_id for camera_id, is_successful in results.items() if not is_successful]
+
+        if len(failed) > 0:
+            _LOGGER.warning(
+                f"Failed to {command} {len(failed)}/{len(results)} camera of {self.name}: "
+                f"{', '.join(failed)}"
+            )
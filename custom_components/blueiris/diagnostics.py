@@ -0,0 +1,72 @@
+"""
+Diagnostics support for Blue Iris.
+For more details about this platform, please refer to the documentation at
+https://www.home-assistant.io/integrations/diagnostics/
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api.serializer import SERIALIZER
+from .helpers import get_ha
+from .helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    _LOGGER.debug(f"Starting diagnostic tool for {entry.title}")
+
+    data = {"entry": async_redact_data(entry.as_dict(), TO_REDACT)}
+
+    ha = get_ha(hass, entry.entry_id)
+
+    if ha is not None and ha.api is not None:
+        api = ha.api
+
+        data["api"] = {
+            "is_logged_in": getattr(api, "is_logged_in", False),
+            "cameras": len(getattr(api, "camera_list", [])),
+            "command_timing": dict(api.command_timing),
+            "session_age": api.session_age,
+            "session": dict(api.session_metrics),
+            "circuit_breaker": api.circuit_breaker.stats,
+            "serializer": SERIALIZER,
+        }
+
+    if ha is not None and ha.entity_manager is not None:
+        entity_manager = ha.entity_manager
+
+        data["mqtt"] = {
+            "messages_received": entity_manager.mqtt_messages_received,
+            "batches_applied": entity_manager.mqtt_batches_applied,
+        }
+
+        data["entities_reconciliation"] = entity_manager.update_coordinator.metrics
+
+        data["state_writes"] = {
+            "written": entity_manager.state_writes,
+            "skipped": entity_manager.state_writes_skipped,
+        }
+
+    if ha is not None:
+        data["update"] = ha.update_coordinator.metrics
+        data["update_interval"] = ha.poll_scheduler.interval
+        data["image_cache"] = ha.image_cache.stats
+        data["connection_pool"] = ha.connection_pool.stats
+        data["hub"] = {
+            "servers": ha.hub.servers,
+            "next_poll_in": ha.poll_scheduler.next_run_in,
+        }
+
+    return data
@@ -5,7 +5,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from ..managers.home_assistant import BlueIrisHomeAssistant
+from ..managers.hub import BlueIrisHub
 from ..managers.password_manager import PasswordManager
+from ..managers.storage_manager import StorageManager
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,6 +20,26 @@ def clear_ha(hass: HomeAssistant, entry_id):
     del hass.data[DATA_BLUEIRIS][entry_id]
 
 
+def get_storage_manager(hass: HomeAssistant) -> StorageManager:
+    if STORAGE_MANAGER_BLUEIRIS not in hass.data:
+        hass.data[STORAGE_MANAGER_BLUEIRIS] = StorageManager(hass)
+
+    storage_manager = hass.data[STORAGE_MANAGER_BLUEIRIS]
+
+    return storage_manager
+
+
+def get_password_manager(hass: HomeAssistant) -> PasswordManager:
+    if PASSWORD_MANAGER_BLUEIRIS not in hass.data:
+        storage_manager = get_storage_manager(hass)
+
+        hass.data[PASSWORD_MANAGER_BLUEIRIS] = PasswordManager(hass, storage_manager)
+
+    password_manager = hass.data[PASSWORD_MANAGER_BLUEIRIS]
+
+    return password_manager
+
+
 def get_ha(hass: HomeAssistant, entry_id):
     ha_data = hass.data.get(DATA_BLUEIRIS, {})
     ha = ha_data.get(entry_id)
@@ -30,12 +52,13 @@ async def async_set_ha(hass: HomeAssistant, entry: ConfigEntry):
         if DATA_BLUEIRIS not in hass.data:
             hass.data[DATA_BLUEIRIS] = {}
 
-        if PASSWORD_MANAGER_BLUEIRIS not in hass.data:
-            hass.data[PASSWORD_MANAGER_BLUEIRIS] = PasswordManager(hass)
+        if DATA_BLUEIRIS_HUB not in hass.data:
+            hass.data[DATA_BLUEIRIS_HUB] = BlueIrisHub(hass)
 
-        password_manager = hass.data[PASSWORD_MANAGER_BLUEIRIS]
+        password_manager = get_password_manager(hass)
+        hub = hass.data[DATA_BLUEIRIS_HUB]
 
-        instance = BlueIrisHomeAssistant(hass, password_manager)
+        instance = BlueIrisHomeAssistant(hass, password_manager, hub)
 
         await instance.async_init(entry)
 
@@ -1,10 +1,14 @@
 import copy
+import hashlib
 import logging
+import os
 
 import yaml
 
+from homeassistant.components.media_player import MediaPlayerEntityFeature
 from homeassistant.core import HomeAssistant
 from homeassistant.util import slugify
+from homeassistant.util.file import write_utf8_file_atomic
 
 from ..models.camera_data import CameraData
 from ..models.config_data import ConfigData
@@ -20,26 +24,78 @@ class AdvancedConfigurationGenerator:
 
         self._ha = ha
 
-    def generate(self):
-        media_players = self._hass.states.async_entity_ids("media_player")
-
+    async def async_generate(self):
+        """Collect data in the event loop, render and write files in executor."""
         config_data: ConfigData = self._ha.config_data
 
         base_url = self._ha.api.base_url
-        camera_list = self._ha.api.camera_list
+        camera_list = list(self._ha.api.camera_list)
+        cast_devices = self._get_cast_devices()
         # available_profiles = self._ha.api.data.get("profiles", [])
 
-        self._generate_components(
+        entity_manager = self._ha.entity_manager
+
+        camera_entities = dict(entity_manager.get_entities(DOMAIN_CAMERA))
+        binary_sensors_entities = dict(
+            entity_manager.get_entities(DOMAIN_BINARY_SENSOR)
+        )
+        switch_entities = dict(entity_manager.get_entities(DOMAIN_SWITCH))
+
+        await self._hass.async_add_executor_job(
+            self._generate_components,
             config_data.name,
             camera_list,
-            media_players,
+            cast_devices,
             base_url,
             config_data.username,
             config_data.password_clear_text,
             config_data.stream_type,
         )
 
-        self.generate_ui_lovelace()
+        await self._hass.async_add_executor_job(
+            self.generate_ui_lovelace,
+            config_data.name,
+            camera_entities,
+            binary_sensors_entities,
+            switch_entities,
+        )
+
+    def _get_cast_devices(self) -> list[tuple[str, str]]:
+        """Name and entity ID of media players supporting play media."""
+        cast_devices = []
+
+        for entity_id in self._hass.states.async_entity_ids("media_player"):
+            state = self._hass.states.get(entity_id)
+
+            if ATTR_FRIENDLY_NAME in state.attributes:
+                name = state.attributes[ATTR_FRIENDLY_NAME]
+            else:
+                name = state.name
+
+            supported_features = state.attributes.get("supported_features", 0)
+            support_play_media = bool(supported_features & MediaPlayerEntityFeature.PLAY_MEDIA)
+
+            if support_play_media:
+                cast_devices.append((name, entity_id))
+
+        return cast_devices
+
+    @staticmethod
+    def _write_file(path: str, content: str):
+        """Write atomically, skipped when content is unchanged."""
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                current_hash = hashlib.sha256(file.read()).hexdigest()
+
+            if current_hash == content_hash:
+                _LOGGER.debug(f"Skip writing {path}, content unchanged")
+                return
+
+        write_utf8_file_atomic(path, content)
+
+        _LOGGER.debug(f"{path} written")
 
     @staticmethod
     def _generate_lovelace(
@@ -88,7 +144,7 @@ class AdvancedConfigurationGenerator:
         self,
         integration_name,
         camera_list: list[CameraData],
-        media_players,
+        cast_devices: list[tuple[str, str]],
         base_url,
         username,
         password,
@@ -104,14 +160,14 @@ class AdvancedConfigurationGenerator:
             input_select, integration_name, camera_list
         )
         input_select_cast_devices = self._set_input_select_cast_devices(
-            input_select, integration_name, media_players
+            input_select, integration_name, cast_devices
         )
 
         script_placeholders = self._set_script_cast(
             script,
             integration_name,
             camera_list,
-            media_players,
+            cast_devices,
             input_select_cast_devices,
             input_select_camera,
             base_url,
@@ -131,8 +187,7 @@ class AdvancedConfigurationGenerator:
 
             content = content.replace(script_placeholder, replace_with)
 
-        with open(components_path, "w+") as file:
-            file.write(content)
+        self._write_file(components_path, content)
 
     @staticmethod
     def _set_input_select_camera(
@@ -171,8 +226,9 @@ class AdvancedConfigurationGenerator:
 
         return component_key
 
+    @staticmethod
     def _set_input_select_cast_devices(
-        self, input_select, integration_name, media_players
+        input_select, integration_name, cast_devices: list[tuple[str, str]]
     ):
         component_type = "cast_devices"
         component_name = f"{integration_name} Cast Devices"
@@ -182,22 +238,11 @@ class AdvancedConfigurationGenerator:
         initial_option = None
         options = []
 
-        for entity_id in media_players:
-            state = self._hass.states.get(entity_id)
+        for name, _entity_id in cast_devices:
+            options.append(name)
 
-            if ATTR_FRIENDLY_NAME in state.attributes:
-                name = state.attributes[ATTR_FRIENDLY_NAME]
-            else:
-                name = state.name
-
-            supported_features = state.attributes.get("supported_features", 0)
-            support_play_media = bool(supported_features & MediaPlayerEntityFeature.PLAY_MEDIA)
-
-            if support_play_media:
-                options.append(name)
-
-                if initial_option is None:
-                    initial_option = name
+            if initial_option is None:
+                initial_option = name
 
         component["name"] = component_name
         component["initial"] = initial_option
@@ -211,12 +256,12 @@ class AdvancedConfigurationGenerator:
 
         return component_key
 
+    @staticmethod
     def _set_script_cast(
-        self,
         script,
         integration_name,
         camera_list: list[CameraData],
-        media_players,
+        cast_devices: list[tuple[str, str]],
         input_select_cast_devices,
         input_select_camera,
         base_url,
@@ -254,20 +299,9 @@ class AdvancedConfigurationGenerator:
         stream_source = f"'{url}/' ~ camera_list[states.input_select.{input_select_camera}.state] ~ '{qs}'"
 
         media_player_items = []
-        for entity_id in media_players:
-            state = self._hass.states.get(entity_id)
-
-            if ATTR_FRIENDLY_NAME in state.attributes:
-                name = state.attributes[ATTR_FRIENDLY_NAME]
-            else:
-                name = state.name
-
-            supported_features = state.attributes.get("supported_features", 0)
-            support_play_media = bool(supported_features & MediaPlayerEntityFeature.PLAY_MEDIA)
-
-            if support_play_media:
-                media_player_item = f"""{name}"": ""{entity_id}"""
-                media_player_items.append(media_player_item)
+        for name, entity_id in cast_devices:
+            media_player_item = f"""{name}"": ""{entity_id}"""
+            media_player_items.append(media_player_item)
 
         media_player_sources = ", ".join(media_player_items)
 
@@ -298,7 +332,13 @@ class AdvancedConfigurationGenerator:
 
         return result
 
-    def generate_ui_lovelace(self):
+    def generate_ui_lovelace(
+        self,
+        integration_name,
+        camera_entities: dict[str, EntityData],
+        binary_sensors_entities: dict[str, EntityData],
+        switch_entities: dict[str, EntityData],
+    ):
         lines = [
             "layout: horizontal",
             "max_columns: 3",
@@ -306,51 +346,47 @@ class AdvancedConfigurationGenerator:
             "cards:",
         ]
 
-        entity_manager = self._ha.entity_manager
-
-        camera_entities = entity_manager.get_entities(DOMAIN_CAMERA)
-        binary_sensors_entities = entity_manager.get_entities(DOMAIN_BINARY_SENSOR)
-        switch_entities = entity_manager.get_entities(DOMAIN_SWITCH)
-
         ui_system_camera = []
         ui_user_camera = []
         ui_system_components = {}
 
+        # Single pass, binary sensors by camera ID, system sensors have no ID
+        camera_binary_sensors: dict[str, dict[str, EntityData]] = {}
+
+        for binary_sensors_entity_name in binary_sensors_entities:
+            binary_sensors_entity = binary_sensors_entities[binary_sensors_entity_name]
+            binary_sensors_entity_id = binary_sensors_entity.id
+
+            if binary_sensors_entity_id is None:
+                if DOMAIN_BINARY_SENSOR not in ui_system_components:
+                    ui_system_components[DOMAIN_BINARY_SENSOR] = []
+
+                ui_system_components[DOMAIN_BINARY_SENSOR].append(binary_sensors_entity)
+
+            else:
+                if binary_sensors_entity_id not in camera_binary_sensors:
+                    camera_binary_sensors[binary_sensors_entity_id] = {}
+
+                camera_binary_sensors[binary_sensors_entity_id][
+                    binary_sensors_entity_name
+                ] = binary_sensors_entity
+
         for camera_entity_name in camera_entities:
             camera_entity = camera_entities[camera_entity_name]
             camera_entity_id = camera_entity.id
 
             ui_component = {DOMAIN_CAMERA: camera_entity}
 
-            for binary_sensors_entity_name in binary_sensors_entities:
-                binary_sensors_entity = binary_sensors_entities[
-                    binary_sensors_entity_name
-                ]
-                binary_sensors_entity_id = binary_sensors_entity.id
-
-                if binary_sensors_entity_id == camera_entity_id:
-                    if DOMAIN_BINARY_SENSOR not in ui_component:
-                        ui_component[DOMAIN_BINARY_SENSOR] = {}
+            binary_sensors = camera_binary_sensors.get(camera_entity_id)
 
-                    ui_component[DOMAIN_BINARY_SENSOR][
-                        binary_sensors_entity_name
-                    ] = binary_sensors_entity
+            if binary_sensors is not None:
+                ui_component[DOMAIN_BINARY_SENSOR] = binary_sensors
 
             if camera_entity_id in SYSTEM_CAMERA_ID:
                 ui_system_camera.append(ui_component)
             else:
                 ui_user_camera.append(ui_component)
 
-        for binary_sensors_entity_name in binary_sensors_entities:
-            binary_sensors_entity = binary_sensors_entities[binary_sensors_entity_name]
-            binary_sensors_entity_id = binary_sensors_entity.id
-
-            if binary_sensors_entity_id is None:
-                if DOMAIN_BINARY_SENSOR not in ui_system_components:
-                    ui_system_components[DOMAIN_BINARY_SENSOR] = []
-
-                ui_system_components[DOMAIN_BINARY_SENSOR].append(binary_sensors_entity)
-
         for switch_entity_name in switch_entities:
             switch_entity = switch_entities[switch_entity_name]
 
@@ -380,11 +416,10 @@ class AdvancedConfigurationGenerator:
         result = "\n".join(lines)
 
         lovelace_path = self._hass.config.path(
-            f"{slugify(self._ha.config_data.name)}.lovelace.yaml"
+            f"{slugify(integration_name)}.lovelace.yaml"
         )
 
-        with open(lovelace_path, "w+") as file:
-            file.write(result)
+        self._write_file(lovelace_path, result)
 
     @staticmethod
     def generate_camera_section(lines, camera_type, camera_list):
@@ -35,6 +35,12 @@ CONF_ALLOWED_DIO_SENSOR = "allowed_dio_sensor"
 CONF_ALLOWED_EXTERNAL_SENSOR = "allowed_external_sensor"
 
 CONF_SUPPORT_STREAM = "support_stream"
+CONF_MQTT_COALESCE_WINDOW = "mqtt_coalesce_window"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_IMAGE_CACHE_TTL = "image_cache_ttl"
+CONF_CONNECTION_LIMIT = "connection_limit"
+CONF_EXCLUDED_ATTRIBUTES = "excluded_attributes"
 
 BI_ATTR_NAME = "optionDisplay"
 BI_ATTR_ID = "optionValue"
@@ -42,6 +48,7 @@ BI_ATTR_AUDIO = "audio"
 BI_ATTR_IS_ONLINE = "isOnline"
 BI_ATTR_GROUP = "group"
 BI_ATTR_TYPE = "type"
+BI_ATTR_FPS = "FPS"
 
 BI_NON_GENERIC_ATTRIBUTES = [
     BI_ATTR_NAME,
@@ -84,10 +91,19 @@ VERSION = "2.0.0"
 
 DOMAIN = "blueiris"
 PASSWORD_MANAGER_BLUEIRIS = f"pm_{DOMAIN}"
+PASSWORD_CACHE_MAX_SIZE = 16  # decrypted credentials
+STORAGE_MANAGER_BLUEIRIS = f"sm_{DOMAIN}"
+STORAGE_SAVE_DELAY = 5  # seconds
 DATA_BLUEIRIS = f"data_{DOMAIN}"
 DATA_BLUEIRIS_API = f"{DATA_BLUEIRIS}_API"
 DATA_BLUEIRIS_HA = f"{DATA_BLUEIRIS}_HA"
 DATA_BLUEIRIS_HA_ENTITIES = f"{DATA_BLUEIRIS}_HA_Entities"
+DATA_BLUEIRIS_HUB = f"{DATA_BLUEIRIS}_HUB"
+
+SNAPSHOT_DATA = "data"
+SNAPSHOT_STATUS = "status"
+SNAPSHOT_CAMERA_LIST = "camera_list"
+SNAPSHOT_SAVE_DELAY = 60  # seconds
 DEFAULT_NAME = "BlueIris"
 DEFAULT_PORT = "80"
 DEFAULT_VERSION = "0.0.0.0"
@@ -130,10 +146,17 @@ NOTIFICATION_TITLE = f"{DEFAULT_NAME} Setup"
 DEFAULT_ICON = "mdi:alarm-light"
 SCHEDULE_ICON = "mdi:calendar-clock"
 ATTR_FRIENDLY_NAME = "friendly_name"
+ATTR_CIRCUIT_BREAKER = "Circuit breaker"
 
 PROTOCOLS = {True: "https", False: "http"}
 
 SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_MIN_SCAN_INTERVAL = 10  # seconds
+DEFAULT_MAX_SCAN_INTERVAL = 300  # seconds
+MAX_SCAN_INTERVAL_LIMIT = 3600  # seconds
+SLOW_UPDATE_THRESHOLD = 5  # seconds
+POLL_STATUS_KEYS = ("profile", "schedule", "signal", "lock")
+POLL_STAGGER_TOLERANCE = 0.9  # fraction of the even spacing between servers
 
 DEFAULT_FORCE_UPDATE = False
 
@@ -159,6 +182,8 @@ MQTT_MESSAGE_VALUE_UNKNOWN = "unknown"
 
 MQTT_ALL_TOPIC = "BlueIris/+/Status"
 DEFAULT_QOS = 0
+DEFAULT_MQTT_COALESCE_WINDOW = 100  # milliseconds
+MAX_MQTT_COALESCE_WINDOW = 1000  # milliseconds
 
 CONFIG_OPTIONS = "options"
 CONFIG_CONDITIONS = "conditions"
@@ -221,6 +246,17 @@ ATTR_BLUE_IRIS_CAMERA = {
     "error": BI_CAMERA_ATTR_ERROR,
     "group": BI_CAMERA_ATTR_GROUP_CAMERAS,
 }
+CAMERA_ATTRIBUTE_KEYS = tuple(ATTR_BLUE_IRIS_CAMERA.keys())
+CAMERA_ATTRIBUTE_NAMES = tuple(ATTR_BLUE_IRIS_CAMERA.values())
+
+# Measurement and counters changing on most updates, can be excluded from change detection
+VOLATILE_CAMERA_ATTRIBUTES = [
+    BI_CAMERA_ATTR_FPS,
+    BI_CAMERA_ATTR_ALERTS_HASH,
+    BI_CAMERA_ATTR_TRIGGERS_HASH,
+    BI_CAMERA_ATTR_CLIPS_HASH,
+    BI_CAMERA_ATTR_NO_SIGNAL_HASH,
+]
 ATTR_BLUE_IRIS_STATUS = [
     "system name",
     "version",
@@ -269,6 +305,8 @@ ENTITY_CAMERA_DETAILS = "camera-details"
 ENTITY_BINARY_SENSOR_TYPE = "binary-sensor-type"
 ENTITY_DISABLED = "disabled"
 
+ENTITY_RUNTIME_FIELDS = ["status", "disabled"]
+
 
 ENTITY_STATUS = "entity-status"
 ENTITY_STATUS_EMPTY = None
@@ -278,6 +316,9 @@ ENTITY_STATUS_MODIFIED = f"{ENTITY_STATUS}-modified"
 ENTITY_STATUS_IGNORE = f"{ENTITY_STATUS}-ignore"
 ENTITY_STATUS_CANCELLED = f"{ENTITY_STATUS}-cancelled"
 
+ENTITY_SOURCE_SYSTEM = "system"
+ENTITY_SOURCE_CAMERA = "camera"
+
 CONF_CLEAR_CREDENTIALS = "clear-credentials"
 CONF_GENERATE_CONFIG_FILES = "generate-config-files"
 CONF_RESET_COMPONENTS_SETTINGS = "reset-components-settings"
@@ -292,6 +333,29 @@ CONF_STILL_IMAGE_URL = "still_image_url"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_FRAMERATE = "framerate"
 
+DEFAULT_IMAGE_CACHE_TTL = 1000  # milliseconds
+MAX_IMAGE_CACHE_TTL = 60000  # milliseconds
+IMAGE_CACHE_MAX_SIZE = 32 * 1024 * 1024  # bytes
+IMAGE_REQUEST_TIMEOUT = 10  # seconds
+CONTROL_REQUEST_TIMEOUT = 10  # seconds
+BULK_COMMAND_CONCURRENCY = 4  # group camera commands sent at once
+DEFAULT_CONNECTION_LIMIT = 10  # connections per host, per pool
+MAX_CONNECTION_LIMIT = 100  # connections per host, per pool
+CONNECTION_KEEPALIVE_TIMEOUT = 60  # seconds
+DNS_CACHE_TTL = 300  # seconds
+
+CIRCUIT_BREAKER_CLOSED = "closed"
+CIRCUIT_BREAKER_OPEN = "open"
+CIRCUIT_BREAKER_HALF_OPEN = "half_open"
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # consecutive failed requests
+CIRCUIT_BREAKER_OPEN_DURATION = 10  # seconds, doubled on every failed probe
+CIRCUIT_BREAKER_MAX_OPEN_DURATION = 300  # seconds
+IMAGE_RESIZED_QUALITY = 75  # JPEG quality of resized images (1-100)
+
+BI_IMAGE_WIDTH = "w"
+BI_IMAGE_HEIGHT = "h"
+BI_IMAGE_QUALITY = "q"
+
 LOG_LEVEL_DEFAULT = "Default"
 LOG_LEVEL_DEBUG = "Debug"
 LOG_LEVEL_INFO = "Info"
@@ -11,13 +11,14 @@ from homeassistant.helpers import config_validation as cv
 
 from .. import get_ha
 from ..api.blue_iris_api import BlueIrisApi
+from ..helpers import get_password_manager, get_storage_manager
 from ..helpers.const import *
 from ..managers.configuration_manager import ConfigManager
 from ..managers.password_manager import PasswordManager
 from ..models import LoginError
 from ..models.camera_data import CameraData
 from ..models.config_data import ConfigData
-from .storage_manager import StorageManager
+from ..models.storage_data import StorageIntegrationData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +49,7 @@ class ConfigFlowManager:
         self._config_entry = config_entry
         self._hass = hass
 
-        self._password_manager = PasswordManager(self._hass)
+        self._password_manager = get_password_manager(self._hass)
         self._config_manager = ConfigManager(self._password_manager)
 
         data = {}
@@ -193,6 +194,14 @@ class ConfigFlowManager:
                 "name": CONF_ALLOWED_SCHEDULE,
                 "enabled": is_admin,
             },
+            {
+                "checked": config_data.excluded_attributes,
+                "items": {
+                    attribute: attribute for attribute in VOLATILE_CAMERA_ATTRIBUTES
+                },
+                "name": CONF_EXCLUDED_ATTRIBUTES,
+                "enabled": True,
+            },
         ]
 
         fields = self._get_default_fields(CONFIG_FLOW_OPTIONS)
@@ -210,6 +219,29 @@ class ConfigFlowManager:
                 vol.Optional(CONF_SUPPORT_STREAM, default=config_data.support_stream)
             ] = bool
 
+        fields[
+            vol.Optional(CONF_MIN_SCAN_INTERVAL, default=config_data.min_scan_interval)
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_SCAN_INTERVAL_LIMIT))
+
+        fields[
+            vol.Optional(CONF_MAX_SCAN_INTERVAL, default=config_data.max_scan_interval)
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_SCAN_INTERVAL_LIMIT))
+
+        fields[
+            vol.Optional(CONF_IMAGE_CACHE_TTL, default=config_data.image_cache_ttl)
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_IMAGE_CACHE_TTL))
+
+        fields[
+            vol.Optional(CONF_CONNECTION_LIMIT, default=config_data.connection_limit)
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONNECTION_LIMIT))
+
+        if DATA_MQTT in self._hass.data:
+            fields[
+                vol.Optional(
+                    CONF_MQTT_COALESCE_WINDOW, default=config_data.mqtt_coalesce_window
+                )
+            ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_MQTT_COALESCE_WINDOW))
+
         fields[vol.Optional(CONF_LOG_LEVEL, default=config_data.log_level)] = vol.In(
             LOG_LEVELS
         )
@@ -348,12 +380,17 @@ class ConfigFlowManager:
 
         generate_configuration_files = CONF_GENERATE_CONFIG_FILES in actions
 
-        storage_manager = StorageManager(self._hass)
+        storage_manager = get_storage_manager(self._hass)
         data = await storage_manager.async_load_from_store()
-        integration_data = data.integrations.get(self.title, {})
-        integration_data[CONF_GENERATE_CONFIG_FILES] = generate_configuration_files
+        integration_data = data.integrations.get(self.title)
+
+        if integration_data is None:
+            integration_data = StorageIntegrationData()
+            data.integrations[self.title] = integration_data
+
+        integration_data.generate_configuration_files = generate_configuration_files
 
-        await storage_manager.async_save_to_store(data)
+        storage_manager.delay_save_to_store(data)
 
     def _get_ha(self, key: str = None):
         if key is None:
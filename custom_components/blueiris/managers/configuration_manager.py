@@ -52,6 +52,29 @@ class ConfigManager:
 
         result.support_stream = options.get(CONF_SUPPORT_STREAM, False)
 
+        result.mqtt_coalesce_window = options.get(
+            CONF_MQTT_COALESCE_WINDOW, DEFAULT_MQTT_COALESCE_WINDOW
+        )
+
+        result.min_scan_interval = options.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        )
+
+        result.max_scan_interval = max(
+            result.min_scan_interval,
+            options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+        )
+
+        result.image_cache_ttl = options.get(
+            CONF_IMAGE_CACHE_TTL, DEFAULT_IMAGE_CACHE_TTL
+        )
+
+        result.connection_limit = options.get(
+            CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT
+        )
+
+        result.excluded_attributes = options.get(CONF_EXCLUDED_ATTRIBUTES, [])
+
         self.config_entry = config_entry
         self.data = result
 
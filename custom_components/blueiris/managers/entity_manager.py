@@ -5,8 +5,9 @@ from typing import Optional
 from homeassistant.components.camera import DEFAULT_CONTENT_TYPE
 from homeassistant.components.stream import DOMAIN as DOMAIN_STREAM
 from homeassistant.const import CONF_AUTHENTICATION
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import EntityRegistry
 
 from ..api.blue_iris_api import BlueIrisApi
@@ -16,6 +17,7 @@ from ..models.config_data import ConfigData
 from ..models.entity_data import EntityData
 from .configuration_manager import ConfigManager
 from .device_manager import DeviceManager
+from .update_coordinator import UpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +34,10 @@ class EntityManager:
     entities: dict
     domain_component_manager: dict
     mqtt_states: dict
+    mqtt_messages_received: int
+    mqtt_batches_applied: int
+    state_writes: int
+    state_writes_skipped: int
 
     def __init__(self, hass, ha):
         self.hass = hass
@@ -40,6 +46,33 @@ class EntityManager:
         self.entities = {}
         self.mqtt_states = {}
 
+        self._context_fingerprint = None
+        self._source_fingerprints = {}
+        self._source_entities = {}
+        self._current_source = None
+        self._active_entities = set()
+        self._pending_entities = set()
+        self._mqtt_entities = {}
+        self._alerts = {}
+        self._alert_events = {}
+
+        self._device_entities = {}
+        self._unique_id_entities = {}
+
+        self._pending_mqtt_states = {}
+        self._mqtt_flush_handle = None
+        self.mqtt_messages_received = 0
+        self.mqtt_batches_applied = 0
+        self.state_writes = 0
+        self.state_writes_skipped = 0
+
+        self._update_coordinator = UpdateCoordinator(
+            hass, "entities reconciliation", self._async_update
+        )
+        self._mqtt_coordinator = UpdateCoordinator(
+            hass, "MQTT states", self._async_apply_mqtt_states
+        )
+
     @property
     def entity_registry(self) -> EntityRegistry:
         return self.ha.entity_registry
@@ -68,6 +101,14 @@ class EntityManager:
     def system_device_name(self) -> str:
         return self.device_manager.get_system_device_name()
 
+    @property
+    def main_binary_sensor_name(self) -> str:
+        return f"{self.integration_title} Alerts"
+
+    @property
+    def update_coordinator(self) -> UpdateCoordinator:
+        return self._update_coordinator
+
     def set_domain_component(self, domain, async_add_entities, component):
         self.domain_component_manager[domain] = {
             "async_add_entities": async_add_entities,
@@ -75,25 +116,44 @@ class EntityManager:
         }
 
     def is_device_name_in_use(self, device_name):
-        result = False
+        device_entities = self._device_entities.get(device_name)
 
-        for entity in self.get_all_entities():
-            if entity.device_name == device_name:
-                result = True
-                break
+        result = device_entities is not None and len(device_entities) > 0
 
         return result
 
     def get_all_entities(self) -> list[EntityData]:
-        entities = []
-        for domain in self.entities:
-            for name in self.entities[domain]:
-                entity = self.entities[domain][name]
-
-                entities.append(entity)
+        entities = [
+            self.entities[domain][name]
+            for domain, name in self._unique_id_entities.values()
+        ]
 
         return entities
 
+    def _add_to_index(self, domain, name, entity: EntityData):
+        entity_key = (domain, name)
+
+        if entity.device_name not in self._device_entities:
+            self._device_entities[entity.device_name] = set()
+
+        self._device_entities[entity.device_name].add(entity_key)
+
+        self._unique_id_entities[entity.unique_id] = entity_key
+
+    def _remove_from_index(self, domain, name, entity: EntityData):
+        entity_key = (domain, name)
+
+        device_entities = self._device_entities.get(entity.device_name)
+
+        if device_entities is not None:
+            device_entities.discard(entity_key)
+
+            if len(device_entities) == 0:
+                del self._device_entities[entity.device_name]
+
+        if self._unique_id_entities.get(entity.unique_id) == entity_key:
+            del self._unique_id_entities[entity.unique_id]
+
     def check_domain(self, domain):
         if domain not in self.entities:
             self.entities[domain] = {}
@@ -122,18 +182,85 @@ class EntityManager:
 
     def delete_entity(self, domain, name):
         if domain in self.entities and name in self.entities[domain]:
-            del self.entities[domain][name]
+            entity = self.entities[domain].pop(name)
+
+            self._remove_from_index(domain, name, entity)
+
+            if domain == DOMAIN_BINARY_SENSOR and entity.topic:
+                key = _get_camera_binary_sensor_key(entity.topic, entity.event)
+
+                if self._mqtt_entities.get(key) == name:
+                    del self._mqtt_entities[key]
+
+        self._pending_entities.discard((domain, name))
+
+        if domain == DOMAIN_BINARY_SENSOR:
+            self._remove_alert(name)
 
     def set_entity(self, domain, name, data: EntityData):
         try:
             self.check_domain(domain)
 
+            entity_key = (domain, name)
+            existing_entity = self.entities[domain].get(name)
+
+            if (
+                existing_entity is not None
+                and existing_entity.status == ENTITY_STATUS_READY
+                and existing_entity.unique_id == data.unique_id
+            ):
+                data.status = ENTITY_STATUS_READY
+                data.disabled = existing_entity.disabled
+
+            if existing_entity is not None:
+                self._remove_from_index(domain, name, existing_entity)
+
             self.entities[domain][name] = data
+
+            self._add_to_index(domain, name, data)
+
+            self._active_entities.add(entity_key)
+
+            if self._current_source is not None:
+                self._source_entities[self._current_source].add(entity_key)
+
+            if data.status == ENTITY_STATUS_CREATED:
+                self._pending_entities.add(entity_key)
+
+            if domain == DOMAIN_BINARY_SENSOR:
+                self._set_alert(name, data)
         except Exception as ex:
             self.log_exception(
                 ex, f"Failed to set_entity, domain: {domain}, name: {name}"
             )
 
+    def _set_alert(self, name, entity: EntityData):
+        """Keep the alerts index of the main binary sensor up to date."""
+        self._remove_alert(name)
+
+        entity_event = entity.event
+
+        if entity_event not in CAMERA_SENSORS:
+            return
+
+        is_on = entity.state
+
+        if entity_event == SENSOR_CONNECTIVITY_NAME:
+            is_on = not is_on
+
+        if is_on:
+            if entity_event not in self._alerts:
+                self._alerts[entity_event] = {}
+
+            self._alerts[entity_event][name] = None
+            self._alert_events[name] = entity_event
+
+    def _remove_alert(self, name):
+        entity_event = self._alert_events.pop(name, None)
+
+        if entity_event is not None:
+            self._alerts[entity_event].pop(name, None)
+
     def get_mqtt_state(self, topic, event_type, default=False):
         key = _get_camera_binary_sensor_key(topic, event_type)
 
@@ -146,9 +273,133 @@ class EntityManager:
 
         self.mqtt_states[key] = value
 
+    def queue_mqtt_state(self, topic, event_type, value):
+        """Collect MQTT states within the coalescing window, last value wins."""
+        self.mqtt_messages_received += 1
+
+        key = _get_camera_binary_sensor_key(topic, event_type)
+        self._pending_mqtt_states[key] = (topic, event_type, value)
+
+        if self._mqtt_flush_handle is None:
+            delay = self.config_data.mqtt_coalesce_window / 1000
+
+            self._mqtt_flush_handle = self.hass.loop.call_later(
+                delay, self._flush_mqtt_states
+            )
+
+    @callback
+    def _flush_mqtt_states(self):
+        self._mqtt_flush_handle = None
+
+        self._mqtt_coordinator.request()
+
+    async def async_remove(self):
+        if self._mqtt_flush_handle is not None:
+            self._mqtt_flush_handle.cancel()
+            self._mqtt_flush_handle = None
+
+        self._pending_mqtt_states = {}
+
+        await self._mqtt_coordinator.async_stop()
+        await self._update_coordinator.async_stop()
+
+    async def async_update_mqtt_state(self, topic, event_type, value):
+        """Apply MQTT state (with any pending one) without waiting for the window."""
+        key = _get_camera_binary_sensor_key(topic, event_type)
+        self._pending_mqtt_states[key] = (topic, event_type, value)
+
+        await self._mqtt_coordinator.async_request()
+
+    async def _async_apply_mqtt_states(self):
+        """Apply a batch of MQTT states and notify only the affected entities."""
+        pending_mqtt_states = self._pending_mqtt_states
+        self._pending_mqtt_states = {}
+
+        if len(pending_mqtt_states) == 0:
+            return
+
+        for topic, event_type, value in pending_mqtt_states.values():
+            self.set_mqtt_state(topic, event_type, value)
+
+        await self.async_update()
+
+        self.mqtt_batches_applied += 1
+
+        _LOGGER.debug(
+            f"Applied {len(pending_mqtt_states)} MQTT states, "
+            f"Messages: {self.mqtt_messages_received}, "
+            f"Batches: {self.mqtt_batches_applied}"
+        )
+
+        for key in pending_mqtt_states:
+            entity_name = self._mqtt_entities.get(key)
+
+            if entity_name is not None:
+                self.dispatch_entity(DOMAIN_BINARY_SENSOR, entity_name)
+
+        self.dispatch_entity(DOMAIN_BINARY_SENSOR, self.main_binary_sensor_name)
+
+    @staticmethod
+    def get_entity_signal(domain, unique_id):
+        signal = f"{SIGNALS[domain]}_{unique_id}"
+
+        return signal
+
+    def dispatch_entity(self, domain, name):
+        entity = self.get_entity(domain, name)
+
+        if entity is not None:
+            signal = self.get_entity_signal(domain, entity.unique_id)
+
+            async_dispatcher_send(self.hass, signal)
+
     def create_components(self):
-        config_data = self.config_data
         available_camera = self.api.camera_list
+
+        self._active_entities = set()
+        visited_sources = set()
+
+        context_fingerprint = self._get_context_fingerprint()
+
+        if context_fingerprint != self._context_fingerprint:
+            _LOGGER.debug("Configuration changed, all entities will be rebuilt")
+
+            self._context_fingerprint = context_fingerprint
+            self._source_fingerprints = {}
+            self._source_entities = {}
+
+        system_source = (ENTITY_SOURCE_SYSTEM, self.system_device_name)
+        system_fingerprint = self._get_system_fingerprint()
+
+        self._reconcile_source(
+            system_source, system_fingerprint, self.generate_system_switches
+        )
+        visited_sources.add(system_source)
+
+        has_mqtt_binary_sensors = False
+        for camera in available_camera:
+            camera_source = (ENTITY_SOURCE_CAMERA, camera.id)
+            camera_fingerprint = self._get_camera_fingerprint(camera)
+
+            self._reconcile_source(
+                camera_source, camera_fingerprint, self.generate_camera, camera
+            )
+            visited_sources.add(camera_source)
+
+            for domain, _name in self._source_entities.get(camera_source, []):
+                if domain == DOMAIN_BINARY_SENSOR:
+                    has_mqtt_binary_sensors = True
+
+        for source_key in list(self._source_fingerprints.keys()):
+            if source_key not in visited_sources:
+                del self._source_fingerprints[source_key]
+                del self._source_entities[source_key]
+
+        if has_mqtt_binary_sensors:
+            self.generate_main_binary_sensor()
+
+    def generate_system_switches(self):
+        config_data = self.config_data
         available_profiles = self.api.data.get("profiles", [])
         available_schedules = self.api.data.get("schedules", [])
         is_admin = self.api.data.get("admin", False)
@@ -174,31 +425,87 @@ class EntityManager:
                 if allowed_schedule is None or str(schedule_id) in allowed_schedule:
                     self.generate_schedule_switch(schedule_name, system_device_name)
 
-        mqtt_binary_sensors = []
-        for camera in available_camera:
-            self.generate_camera_component(camera)
-            current_mqtt_binary_sensors = self.generate_camera_binary_sensors(camera)
+    def generate_camera(self, camera: CameraData):
+        self.generate_camera_component(camera)
+        self.generate_camera_binary_sensors(camera)
+
+    def _get_context_fingerprint(self):
+        """Values all entities depend on, any change requires full rebuild."""
+        fingerprint = (
+            self.integration_title,
+            self.system_device_name,
+            self.config_data,
+            self.api.base_url,
+            self.api.session_id,
+            DOMAIN_STREAM in self.hass.data,
+        )
+
+        return fingerprint
+
+    def _get_system_fingerprint(self):
+        fingerprint = (
+            self.api.data.get("admin", False),
+            self.api.data.get("profiles", []),
+            self.api.data.get("schedules", []),
+            self.api.status.get("profile", 0),
+            self.api.status.get("schedule", 0),
+        )
+
+        return fingerprint
+
+    def _get_camera_fingerprint(self, camera: CameraData):
+        state_topic = MQTT_ALL_TOPIC.replace("+", camera.id)
+
+        mqtt_states = tuple(
+            self.get_mqtt_state(
+                state_topic,
+                sensor_type_name,
+                sensor_type_name in NEGATIVE_SENSOR_STATE,
+            )
+            for sensor_type_name in CAMERA_SENSORS
+        )
 
-            mqtt_binary_sensors.extend(current_mqtt_binary_sensors)
+        fingerprint = (camera, mqtt_states)
 
-        if len(mqtt_binary_sensors) > 0:
-            self.generate_main_binary_sensor()
+        return fingerprint
 
-    def update(self):
-        self.hass.async_create_task(self._async_update())
+    def _reconcile_source(self, source_key, fingerprint, generate, *args):
+        """Rebuild entities of a source only when its fingerprint changed."""
+        source_entities = self._source_entities.get(source_key)
+
+        if (
+            source_entities is not None
+            and self._source_fingerprints.get(source_key) == fingerprint
+        ):
+            self._active_entities.update(source_entities)
+            return
+
+        self._current_source = source_key
+        self._source_entities[source_key] = set()
 
-    async def _async_update(self):
-        step = "Mark as ignore"
         try:
-            entities_to_delete = []
+            generate(*args)
+        finally:
+            self._current_source = None
 
-            for entity in self.get_all_entities():
-                entities_to_delete.append(entity.unique_id)
+        self._source_fingerprints[source_key] = fingerprint
 
-            step = "Create components"
+    async def async_update(self):
+        await self._update_coordinator.async_request()
 
+    async def _async_update(self):
+        step = "Create components"
+        try:
             self.create_components()
 
+            step = "Mark as ignore"
+
+            entities_to_delete = [
+                entity_key
+                for entity_key in self._unique_id_entities.values()
+                if entity_key not in self._active_entities
+            ]
+
             step = "Start updating"
 
             for domain in SIGNALS:
@@ -209,23 +516,26 @@ class EntityManager:
                 domain_component = domain_component_manager["component"]
                 async_add_entities = domain_component_manager["async_add_entities"]
 
-                entities = dict(self.get_entities(domain))
+                entities = self.get_entities(domain)
+
+                pending_entities = [
+                    entity_key
+                    for pending_domain, entity_key in self._pending_entities
+                    if pending_domain == domain
+                ]
 
-                for entity_key in entities:
+                for entity_key in pending_entities:
                     step = f"Start updating {domain} -> {entity_key}"
 
-                    entity = entities[entity_key]
+                    entity = entities.get(entity_key)
 
-                    entity_id = self.entity_registry.async_get_entity_id(
-                        domain, DOMAIN, entity.unique_id
-                    )
+                    if entity is not None and entity.status == ENTITY_STATUS_CREATED:
+                        entity_id = self.entity_registry.async_get_entity_id(
+                            domain, DOMAIN, entity.unique_id
+                        )
 
-                    if entity.status == ENTITY_STATUS_CREATED:
                         entity_item = self.entity_registry.async_get(entity_id)
 
-                        if entity.unique_id in entities_to_delete:
-                            entities_to_delete.remove(entity.unique_id)
-
                         step = f"Mark as created - {domain} -> {entity_key}"
 
                         entity_component = domain_component(
@@ -258,6 +568,8 @@ class EntityManager:
                         if entity_item is not None:
                             entity.disabled = entity_item.disabled
 
+                    self._pending_entities.discard((domain, entity_key))
+
                 step = f"Add entities to {domain}"
 
                 if len(entities_to_add) > 0:
@@ -266,13 +578,18 @@ class EntityManager:
             if len(entities_to_delete) > 0:
                 _LOGGER.debug(f"Following items will be deleted: {entities_to_delete}")
 
-                for domain in SIGNALS:
-                    entities = dict(self.get_entities(domain))
+                for domain, name in entities_to_delete:
+                    await self.ha.delete_entity(domain, name)
 
-                    for entity_key in entities:
-                        entity = entities[entity_key]
-                        if entity.unique_id in entities_to_delete:
-                            await self.ha.delete_entity(domain, entity.name)
+                step = "Update main binary sensor"
+
+                # Alerts of deleted sensors are gone only now
+                main_binary_sensor = self.get_entity(
+                    DOMAIN_BINARY_SENSOR, self.main_binary_sensor_name
+                )
+
+                if main_binary_sensor is not None:
+                    self.generate_main_binary_sensor()
 
         except Exception as ex:
             self.log_exception(ex, f"Failed to update, step: {step}")
@@ -367,37 +684,28 @@ class EntityManager:
         entity = None
 
         try:
-            entity_name = f"{self.integration_title} Alerts"
+            entity_name = self.main_binary_sensor_name
 
             unique_id = f"{DOMAIN}-{DOMAIN_BINARY_SENSOR}-MAIN-{entity_name}"
 
-            binary_sensors = self.get_entities(DOMAIN_BINARY_SENSOR)
-
-            alerts = {}
-            for binary_sensor_name in binary_sensors:
-                entity = binary_sensors[binary_sensor_name]
-                entity_event = entity.event
-                entity_state = entity.state
+            alerts = self._alerts
 
-                if entity_event is not None:
-                    event_alerts = alerts.get(entity_event, [])
-                    is_on = entity_state
+            state = len(self._alert_events) > 0
 
-                    if entity_event == SENSOR_CONNECTIVITY_NAME:
-                        is_on = not is_on
+            attributes = {ATTR_FRIENDLY_NAME: entity_name}
 
-                    if is_on:
-                        event_alerts.append(binary_sensor_name)
+            for alert_name in alerts:
+                current_alerts = alerts[alert_name]
 
-                        alerts[entity_event] = event_alerts
+                if len(current_alerts) > 0:
+                    attributes[alert_name] = ", ".join(current_alerts)
 
-            state = len(alerts.keys()) > 0
+            for sensor_type_name in CAMERA_SENSORS:
+                current_alerts = alerts.get(sensor_type_name, {})
 
-            attributes = {ATTR_FRIENDLY_NAME: entity_name}
+                attributes[f"{sensor_type_name} #"] = len(current_alerts)
 
-            for alert_name in alerts:
-                current_alerts = alerts[alert_name]
-                attributes[alert_name] = ", ".join(current_alerts)
+            attributes[ATTR_CIRCUIT_BREAKER] = self.api.circuit_breaker.state
 
             entity = EntityData()
 
@@ -482,6 +790,9 @@ class EntityManager:
 
                 self.set_mqtt_state(topic, event_type, state)
 
+                key = _get_camera_binary_sensor_key(topic, event_type)
+                self._mqtt_entities[key] = entity_name
+
                 self.set_entity(DOMAIN_BINARY_SENSOR, entity_name, entity)
 
         except Exception as ex:
@@ -519,7 +830,7 @@ class EntityManager:
                 f"{base_url}/{stream_name}/{camera.id}/{file_name}?session={session_id}"
             )
 
-            fps = camera.data.get("FPS", 1)
+            fps = camera.fps
 
             if fps < 1:
                 fps = 1
@@ -544,9 +855,7 @@ class EntityManager:
                 CONF_STILL_IMAGE_URL: still_image_url,
             }
 
-            for key in ATTR_BLUE_IRIS_CAMERA:
-                key_name = ATTR_BLUE_IRIS_CAMERA[key]
-                attributes[key_name] = camera.data.get(key, NOT_AVAILABLE)
+            attributes.update(zip(CAMERA_ATTRIBUTE_NAMES, camera.attribute_values))
 
             entity = EntityData()
 
@@ -14,37 +14,52 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import EntityRegistry, async_get
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 
 from ..api.blue_iris_api import BlueIrisApi
+from ..api.connection_pool import ConnectionPool
 from ..helpers.advanced_configurations_generator import AdvancedConfigurationGenerator
 from ..helpers.const import *
+from ..models.camera_data import CameraData
 from ..models.config_data import ConfigData
 from .configuration_manager import ConfigManager
 from .device_manager import DeviceManager
 from .entity_manager import EntityManager
+from .hub import BlueIrisHub
+from .image_cache import ImageCache
 from .password_manager import PasswordManager
+from .poll_scheduler import PollScheduler
 from .storage_manager import StorageManager
+from .update_coordinator import UpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class BlueIrisHomeAssistant:
-    def __init__(self, hass: HomeAssistant, password_manager: PasswordManager):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        password_manager: PasswordManager,
+        hub: BlueIrisHub,
+    ):
         self._hass = hass
+        self._hub = hub
 
-        self._remove_async_track_time = None
+        self._poll_scheduler = PollScheduler(hass, self.async_update, hub)
+        self._update_coordinator = UpdateCoordinator(
+            hass, "update", self._async_update
+        )
 
         self._is_initialized = False
-        self._is_updating = False
 
         self._entity_registry = None
 
         self._api = None
         self._entity_manager = None
         self._device_manager = None
-        self._storage_manager = None
+        self._storage_manager = password_manager.storage_manager
         self._config_generator: Optional[AdvancedConfigurationGenerator] = None
+        self._image_cache = ImageCache()
 
         self._config_manager = ConfigManager(password_manager)
 
@@ -72,6 +87,26 @@ class BlueIrisHomeAssistant:
     def storage_manager(self) -> StorageManager:
         return self._storage_manager
 
+    @property
+    def poll_scheduler(self) -> PollScheduler:
+        return self._poll_scheduler
+
+    @property
+    def update_coordinator(self) -> UpdateCoordinator:
+        return self._update_coordinator
+
+    @property
+    def image_cache(self) -> ImageCache:
+        return self._image_cache
+
+    @property
+    def hub(self) -> BlueIrisHub:
+        return self._hub
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        return self._hub.connection_pool
+
     @property
     def config_data(self) -> Optional[ConfigData]:
         if self._config_manager is not None:
@@ -81,11 +116,11 @@ class BlueIrisHomeAssistant:
 
     async def async_init(self, entry: ConfigEntry):
         try:
-            self._storage_manager = StorageManager(self._hass)
-
             await self._config_manager.update(entry)
 
-            self._api = BlueIrisApi(self._hass, self._config_manager)
+            self._api = BlueIrisApi(
+                self._hass, self._config_manager, self.connection_pool
+            )
             self._entity_manager = EntityManager(self._hass, self)
             self._device_manager = DeviceManager(self._hass, self)
             self._config_generator = AdvancedConfigurationGenerator(self._hass, self)
@@ -98,9 +133,7 @@ class BlueIrisHomeAssistant:
 
             _LOGGER.error(error_message)
 
-            data = await self._storage_manager.async_load_from_store()
-            data.key = None
-            await self._storage_manager.async_save_to_store(data)
+            await self._config_manager.password_manager.async_reset_key()
 
             await self._hass.services.async_call(
                 "persistent_notification",
@@ -115,14 +148,37 @@ class BlueIrisHomeAssistant:
             _LOGGER.error(f"Failed to async_init, error: {ex}, line: {line_number}")
 
     async def _async_init(self):
-        await self._hass.config_entries.async_forward_entry_setups(self._config_manager.config_entry, list(SIGNALS.keys()))
+        entry = self._config_manager.config_entry
+
+        await self._hass.config_entries.async_forward_entry_setups(entry, list(SIGNALS.keys()))
 
         self._is_initialized = True
 
+        await self._async_restore_snapshot(entry)
+
         await self.async_update_entry()
 
-    async def _update_entities(self, now):
-        self._hass.async_create_task(self.async_update(now))
+    async def _async_restore_snapshot(self, entry: ConfigEntry):
+        """Create entities from last known data, server is updated right after."""
+        try:
+            snapshot = await self._storage_manager.async_load_snapshot(entry.entry_id)
+
+            if snapshot.is_empty:
+                return
+
+            self._api.restore(snapshot)
+
+            self.device_manager.update()
+            await self.entity_manager.async_update()
+
+            await self.dispatch_all()
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to restore snapshot, Error: {ex}, Line: {line_number}"
+            )
 
     async def async_update_entry(self, entry: ConfigEntry = None):
         update_config_manager = entry is not None
@@ -130,9 +186,7 @@ class BlueIrisHomeAssistant:
         if not update_config_manager:
             entry = self._config_manager.config_entry
 
-            self._remove_async_track_time = async_track_time_interval(
-                self._hass, self._update_entities, SCAN_INTERVAL
-            )
+            self._poll_scheduler.start()
 
         if not self._is_initialized:
             _LOGGER.debug(
@@ -145,6 +199,14 @@ class BlueIrisHomeAssistant:
         if update_config_manager:
             await self._config_manager.update(entry)
 
+        config_data = self.config_data
+
+        await self._hub.async_register(entry.entry_id, config_data.connection_limit)
+
+        self._poll_scheduler.set_bounds(
+            config_data.min_scan_interval, config_data.max_scan_interval
+        )
+
         await self._api.initialize()
 
         await self.async_update(datetime.now())
@@ -154,18 +216,24 @@ class BlueIrisHomeAssistant:
 
         if update_config_manager and integration_data is not None:
             if integration_data.generate_configuration_files:
-                self._hass.loop.call_later(self._hass, 5, self.generate_config_files)
+                async_call_later(self._hass, 5, self.generate_config_files)
 
                 integration_data.generate_configuration_files = False
 
-            await self.storage_manager.async_save_to_store(data)
+                self.storage_manager.delay_save_to_store(data)
 
     async def async_remove(self, entry: ConfigEntry):
         _LOGGER.debug(f"Removing current integration - {entry.title}")
 
-        if self._remove_async_track_time is not None:
-            self._remove_async_track_time()
-            self._remove_async_track_time = None
+        self._poll_scheduler.stop()
+
+        await self._update_coordinator.async_stop()
+        await self._entity_manager.async_remove()
+        await self._api.async_close()
+
+        self._image_cache.clear()
+
+        await self._hub.async_unregister(entry.entry_id)
 
         unload = self._hass.config_entries.async_forward_entry_unload
 
@@ -179,21 +247,43 @@ class BlueIrisHomeAssistant:
     async def async_update(self, event_time):
         if not self._is_initialized:
             _LOGGER.debug(f"NOT INITIALIZED - Failed updating @{event_time}")
+
+            self._update_coordinator.skip()
             return
 
+        _LOGGER.debug(f"Updating @{event_time}")
+
+        await self._update_coordinator.async_request()
+
+    async def _async_update(self):
         try:
-            if self._is_updating:
-                _LOGGER.debug(f"Skip updating @{event_time}")
-                return
+            previous_status = dict(self._api.status)
+            previous_camera_list = self._api.camera_list
+            previous_fingerprint = self._get_fingerprint()
+
+            is_successful = await self._api.async_update()
+
+            has_changed = previous_fingerprint != self._get_fingerprint()
 
-            _LOGGER.debug(f"Updating @{event_time}")
+            is_significant = self._is_significant_change(
+                previous_status, previous_camera_list
+            )
 
-            self._is_updating = True
+            self._poll_scheduler.report(
+                is_successful,
+                self._api.command_timing.get("update"),
+                has_changed,
+                is_significant,
+            )
 
-            await self._api.async_update()
+            if is_successful and has_changed:
+                self._storage_manager.delay_save_snapshot(
+                    self._config_manager.config_entry.entry_id,
+                    lambda: self._api.snapshot,
+                )
 
             self.device_manager.update()
-            self.entity_manager.update()
+            await self.entity_manager.async_update()
 
             await self.dispatch_all()
         except Exception as ex:
@@ -201,7 +291,48 @@ class BlueIrisHomeAssistant:
             line_number = tb.tb_lineno
             _LOGGER.error(f"Failed to async_update, Error: {ex}, Line: {line_number}")
 
-        self._is_updating = False
+            self._poll_scheduler.report(False, None, False, False)
+
+    def _get_fingerprint(self) -> tuple:
+        """Data entities depend on, without measurements changing on every poll."""
+        status = self._api.status
+
+        status_values = tuple(status.get(key) for key in POLL_STATUS_KEYS)
+
+        cameras = tuple(
+            (
+                camera.id,
+                camera.name,
+                camera.is_online,
+                tuple(camera.group_cameras or []),
+            )
+            for camera in self._api.camera_list
+        )
+
+        return status_values, cameras
+
+    def _is_significant_change(
+        self, previous_status: dict, previous_camera_list: list[CameraData]
+    ) -> bool:
+        """Profile / schedule switched or a camera went offline."""
+        if len(previous_status) == 0:
+            return False
+
+        status = self._api.status
+
+        for key in ["profile", "schedule"]:
+            if previous_status.get(key) != status.get(key):
+                return True
+
+        previous_online = {
+            camera.id: camera.is_online for camera in previous_camera_list
+        }
+
+        for camera in self._api.camera_list:
+            if previous_online.get(camera.id, False) and not camera.is_online:
+                return True
+
+        return False
 
     async def delete_entity(self, domain, name):
         try:
@@ -237,4 +368,4 @@ class BlueIrisHomeAssistant:
             async_dispatcher_send(self._hass, signal)
 
     async def generate_config_files(self, _now):
-        self._config_generator.generate()
+        await self._config_generator.async_generate()
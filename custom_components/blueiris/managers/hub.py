@@ -0,0 +1,95 @@
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from ..api.connection_pool import ConnectionPool
+from ..helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BlueIrisHub:
+    """Shared by all BlueIris servers, connection pool and staggered polls."""
+
+    _hass: HomeAssistant
+    _connection_pool: ConnectionPool
+    _connection_limits: dict[str, int]
+    _next_polls: dict[Any, float]
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self._connection_pool = ConnectionPool(hass)
+        self._connection_limits = {}
+        self._next_polls = {}
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        return self._connection_pool
+
+    @property
+    def servers(self) -> int:
+        return len(self._connection_limits)
+
+    async def async_register(self, key: str, connection_limit: int):
+        self._connection_limits[key] = connection_limit
+
+        await self._async_update_connection_limit()
+
+    async def async_unregister(self, key: str):
+        self._connection_limits.pop(key, None)
+
+        if len(self._connection_limits) == 0:
+            await self._connection_pool.async_close()
+        else:
+            await self._async_update_connection_limit()
+
+    def reserve_poll(self, key: Any, delay: float) -> float:
+        """Delay of the next poll, moved away from polls of other servers."""
+        now = self._hass.loop.time()
+
+        other_polls = sorted(
+            next_poll
+            for server_key, next_poll in self._next_polls.items()
+            if server_key != key and next_poll > now
+        )
+
+        def get_distance(poll: float) -> float:
+            return min(
+                (abs(other_poll - poll) for other_poll in other_polls), default=delay
+            )
+
+        # Spread evenly, slightly closer polls are tolerated as timers drift
+        spacing = delay / (len(other_polls) + 1)
+        min_distance = spacing * POLL_STAGGER_TOLERANCE
+        next_poll = now + delay
+
+        if get_distance(next_poll) < min_distance:
+            # Never later than requested, middle of the widest gap within the delay
+            bounds = [now] + [poll for poll in other_polls if poll < next_poll]
+            bounds.append(next_poll)
+
+            candidates = [next_poll]
+            candidates.extend(
+                (start + end) / 2 for start, end in zip(bounds, bounds[1:])
+            )
+
+            next_poll = max(candidates, key=lambda poll: (get_distance(poll), poll))
+
+        self._next_polls[key] = next_poll
+
+        staggered_delay = next_poll - now
+
+        if staggered_delay != delay:
+            _LOGGER.debug(f"Poll moved from {delay:.1f}s to {staggered_delay:.1f}s")
+
+        return staggered_delay
+
+    def release_poll(self, key: Any):
+        self._next_polls.pop(key, None)
+
+    async def _async_update_connection_limit(self):
+        # Limit is per host, each server gets the highest limit configured
+        connection_limit = max(self._connection_limits.values())
+
+        await self._connection_pool.async_set_limit(connection_limit)
@@ -0,0 +1,121 @@
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from ..helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImageCache:
+    """Still images cache shared by all camera of a server (LRU, bounded size)."""
+
+    _images: OrderedDict[Any, tuple[float, bytes]]
+    _requests: dict[Any, asyncio.Task]
+    _max_size: int
+    _size: int
+
+    def __init__(self, max_size: int = IMAGE_CACHE_MAX_SIZE):
+        self._images = OrderedDict()
+        self._requests = {}
+        self._max_size = max_size
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def stats(self) -> dict:
+        stats = {
+            "images": len(self._images),
+            "size": self._size,
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "shared_requests": self._shared,
+        }
+
+        return stats
+
+    async def async_get(
+        self,
+        key: Any,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Optional[bytes]]],
+    ) -> Optional[bytes]:
+        """Return a fresh cached image, or fetch it once for all concurrent callers."""
+        cached_image = self._images.get(key)
+
+        if cached_image is not None:
+            timestamp, image = cached_image
+
+            if time.monotonic() - timestamp < ttl:
+                self._hits += 1
+                self._images.move_to_end(key)
+
+                return image
+
+        request = self._requests.get(key)
+
+        if request is None:
+            self._misses += 1
+
+            request = asyncio.ensure_future(self._async_fetch(key, fetch))
+            self._requests[key] = request
+        else:
+            self._shared += 1
+
+        image = await asyncio.shield(request)
+
+        return image
+
+    def clear(self):
+        for request in self._requests.values():
+            request.cancel()
+
+        self._requests.clear()
+        self._images.clear()
+        self._size = 0
+
+    async def _async_fetch(
+        self, key: Any, fetch: Callable[[], Awaitable[Optional[bytes]]]
+    ) -> Optional[bytes]:
+        try:
+            image = await fetch()
+
+            if image is not None:
+                self._set(key, image)
+
+            return image
+        finally:
+            self._requests.pop(key, None)
+
+    def _set(self, key: Any, image: bytes):
+        self._remove(key)
+
+        if len(image) > self._max_size:
+            _LOGGER.debug(f"Image of {key} is too large to be cached")
+            return
+
+        self._images[key] = (time.monotonic(), image)
+        self._size += len(image)
+
+        while self._size > self._max_size:
+            evicted_key, (_timestamp, evicted_image) = self._images.popitem(last=False)
+            self._size -= len(evicted_image)
+
+            _LOGGER.debug(f"Image of {evicted_key} evicted from cache")
+
+    def _remove(self, key: Any):
+        cached_image = self._images.pop(key, None)
+
+        if cached_image is not None:
+            _timestamp, image = cached_image
+            self._size -= len(image)
@@ -1,3 +1,5 @@
+import asyncio
+from collections import OrderedDict
 import logging
 from os import path, remove
 from typing import Optional
@@ -14,17 +16,46 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PasswordManager:
+    """Shared by all integrations and config flows, see get_password_manager."""
+
     data: Optional[StorageData]
     hass: HomeAssistant
-    crypto: Fernet
+    storage_manager: StorageManager
+    crypto: Optional[Fernet]
 
-    def __init__(self, hass: HomeAssistant):
+    def __init__(self, hass: HomeAssistant, storage_manager: StorageManager):
         self.hass = hass
+        self.storage_manager = storage_manager
         self.data = None
+        self.crypto = None
+
+        self._lock = asyncio.Lock()
+        self._decrypted: OrderedDict[str, str] = OrderedDict()
+
+    async def async_reset_key(self):
+        """Drop the (corrupted) key, a new one is generated on next use."""
+        async with self._lock:
+            storage_manager = self.storage_manager
+
+            data = await storage_manager.async_load_from_store()
+            data.key = None
+
+            await storage_manager.async_save_to_store(data)
+
+            self.data = None
+            self.crypto = None
+            self._decrypted.clear()
 
     async def _load_key(self):
-        if self.data is None:
-            storage_manager = StorageManager(self.hass)
+        if self.crypto is not None:
+            return
+
+        async with self._lock:
+            await self._async_load_key()
+
+    async def _async_load_key(self):
+        if self.crypto is None:
+            storage_manager = self.storage_manager
 
             self.data = await storage_manager.async_load_from_store()
 
@@ -42,6 +73,7 @@ class PasswordManager:
                 await storage_manager.async_save_to_store(self.data)
 
             self.crypto = Fernet(self.data.key.encode())
+            self._decrypted.clear()
 
     async def encrypt(self, data: str):
         await self._load_key()
@@ -53,6 +85,16 @@ class PasswordManager:
     async def decrypt(self, data: str):
         await self._load_key()
 
-        decrypted = self.crypto.decrypt(data.encode()).decode()
+        decrypted = self._decrypted.get(data)
+
+        if decrypted is None:
+            decrypted = self.crypto.decrypt(data.encode()).decode()
+
+            self._decrypted[data] = decrypted
+
+            if len(self._decrypted) > PASSWORD_CACHE_MAX_SIZE:
+                self._decrypted.popitem(last=False)
+        else:
+            self._decrypted.move_to_end(data)
 
         return decrypted
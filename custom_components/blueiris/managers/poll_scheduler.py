@@ -0,0 +1,152 @@
+import logging
+from typing import Any, Callable, Coroutine, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+from ..helpers.const import *
+from .hub import BlueIrisHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """Schedules the next poll based on the outcome of the previous one."""
+
+    _hass: HomeAssistant
+    _action: Callable[[Any], Coroutine[Any, Any, None]]
+    _hub: Optional[BlueIrisHub]
+    _min_interval: float
+    _max_interval: float
+    _interval: float
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        action: Callable[[Any], Coroutine[Any, Any, None]],
+        hub: Optional[BlueIrisHub] = None,
+    ):
+        self._hass = hass
+        self._action = action
+        self._hub = hub
+
+        self._min_interval = DEFAULT_MIN_SCAN_INTERVAL
+        self._max_interval = DEFAULT_MAX_SCAN_INTERVAL
+        self._interval = SCAN_INTERVAL.total_seconds()
+
+        self._remove_listener: Optional[Callable[[], None]] = None
+        self._next_run: Optional[float] = None
+        self._is_running = False
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    @property
+    def next_run_in(self) -> Optional[float]:
+        if self._next_run is None:
+            return None
+
+        return max(self._next_run - self._hass.loop.time(), 0)
+
+    def set_bounds(self, min_interval: float, max_interval: float):
+        self._min_interval = min_interval
+        self._max_interval = max(min_interval, max_interval)
+
+        self._interval = self._get_bounded_interval(self._interval)
+
+    def start(self):
+        self._is_running = True
+
+        if self._remove_listener is None:
+            self._schedule()
+
+    def stop(self):
+        self._is_running = False
+
+        self._cancel()
+
+    def accelerate(self):
+        """Poll at the minimum interval, sooner than the pending poll if needed."""
+        self._interval = self._min_interval
+
+        if not self._is_running:
+            return
+
+        next_run = self._hass.loop.time() + self._interval
+
+        if self._next_run is None or next_run < self._next_run:
+            self._cancel()
+            self._schedule()
+
+    def report(
+        self,
+        is_successful: bool,
+        duration: Optional[float],
+        has_changed: bool,
+        is_significant: bool,
+    ):
+        """Adjust the interval to the outcome of the last poll."""
+        is_slow = duration is not None and duration > SLOW_UPDATE_THRESHOLD
+
+        if not is_successful or is_slow:
+            interval = self._interval * 2
+            reason = "failed" if not is_successful else f"slow ({duration:.3f}s)"
+
+        elif is_significant:
+            interval = self._min_interval
+            reason = "significant change"
+
+        elif has_changed:
+            interval = SCAN_INTERVAL.total_seconds()
+            reason = "changed"
+
+        else:
+            interval = self._interval * 2
+            reason = "unchanged"
+
+        self._interval = self._get_bounded_interval(interval)
+
+        _LOGGER.debug(f"Last update {reason}, next update in {self._interval}s")
+
+    def _get_bounded_interval(self, interval: float) -> float:
+        bounded_interval = min(max(interval, self._min_interval), self._max_interval)
+
+        return bounded_interval
+
+    def _schedule(self):
+        delay = self._interval
+
+        if self._hub is not None:
+            delay = self._hub.reserve_poll(self, delay)
+
+        self._next_run = self._hass.loop.time() + delay
+
+        self._remove_listener = async_call_later(self._hass, delay, self._async_run)
+
+    def _cancel(self):
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+        if self._hub is not None:
+            self._hub.release_poll(self)
+
+        self._next_run = None
+
+    async def _async_run(self, now):
+        self._remove_listener = None
+        self._next_run = None
+
+        if self._hub is not None:
+            self._hub.release_poll(self)
+
+        try:
+            await self._action(now)
+        finally:
+            if self._is_running and self._remove_listener is None:
+                self._schedule()
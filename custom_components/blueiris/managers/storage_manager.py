@@ -1,10 +1,13 @@
 """Storage handers."""
+import asyncio
 import logging
+from typing import Callable, Optional
 
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import Store
 
 from ..helpers.const import *
+from ..models.snapshot_data import SnapshotData
 from ..models.storage_data import StorageData
 
 STORAGE_VERSION = 1
@@ -13,8 +16,17 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class StorageManager:
+    """Shared by all integrations and config flows, see get_storage_manager."""
+
+    _data: Optional[StorageData]
+
     def __init__(self, hass):
         self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, self.file_name, encoder=JSONEncoder)
+        self._data = None
+        self._lock = asyncio.Lock()
+        self._snapshot_stores = {}
+        self._pending_snapshots = set()
 
     @property
     def file_name(self):
@@ -23,17 +35,76 @@ class StorageManager:
         return file_name
 
     async def async_load_from_store(self) -> StorageData:
-        """Load the retained data from store and return de-serialized data."""
-        store = Store(self._hass, STORAGE_VERSION, self.file_name, encoder=JSONEncoder)
+        """Load the retained data once, then return the same in-memory data."""
+        if self._data is None:
+            async with self._lock:
+                if self._data is None:
+                    data = await self._store.async_load()
+
+                    self._data = StorageData.from_dict(data)
+
+        return self._data
+
+    async def async_save_to_store(self, data: StorageData):
+        """Save to the filesystem right away, for data that can't be lost (key)."""
+        self._data = data
+
+        await self._store.async_save(data.to_dict())
+
+    def delay_save_to_store(self, data: StorageData):
+        """Save to the filesystem later, changes until then are written once."""
+        self._data = data
+
+        self._store.async_delay_save(self._get_data_to_save, STORAGE_SAVE_DELAY)
+
+    def _get_data_to_save(self) -> dict:
+        return self._data.to_dict()
+
+    async def async_load_snapshot(self, entry_id: str) -> SnapshotData:
+        """Load the last known server data of an integration."""
+        store = self._get_snapshot_store(entry_id)
 
         data = await store.async_load()
 
-        result = StorageData.from_dict(data)
+        result = SnapshotData.from_dict(data)
 
         return result
 
-    async def async_save_to_store(self, data: StorageData):
-        """Generate dynamic data to store and save it to the filesystem."""
-        store = Store(self._hass, STORAGE_VERSION, self.file_name, encoder=JSONEncoder)
+    def delay_save_snapshot(
+        self, entry_id: str, get_snapshot: Callable[[], SnapshotData]
+    ):
+        """Save the server data later, only the latest is written."""
+        # Re-arming would push the pending write back on every poll
+        if entry_id in self._pending_snapshots:
+            return
+
+        self._pending_snapshots.add(entry_id)
+
+        def get_data() -> dict:
+            self._pending_snapshots.discard(entry_id)
+
+            return get_snapshot().to_dict()
+
+        store = self._get_snapshot_store(entry_id)
+
+        store.async_delay_save(get_data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove_snapshot(self, entry_id: str):
+        store = self._get_snapshot_store(entry_id)
+
+        await store.async_remove()
+
+        del self._snapshot_stores[entry_id]
+        self._pending_snapshots.discard(entry_id)
+
+    def _get_snapshot_store(self, entry_id: str) -> Store:
+        store = self._snapshot_stores.get(entry_id)
+
+        if store is None:
+            file_name = f"{self.file_name}.{entry_id}"
+
+            store = Store(self._hass, STORAGE_VERSION, file_name, encoder=JSONEncoder)
+
+            self._snapshot_stores[entry_id] = store
 
-        await store.async_save(data.to_dict())
+        return store
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import sys
+from typing import Any, Callable, Coroutine, Optional
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UpdateCoordinator:
+    """Runs a single update at a time, with at most one queued follow-up."""
+
+    _hass: HomeAssistant
+    _name: str
+    _action: Callable[[], Coroutine[Any, Any, None]]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        action: Callable[[], Coroutine[Any, Any, None]],
+    ):
+        self._hass = hass
+        self._name = name
+        self._action = action
+
+        self._task: Optional[asyncio.Task] = None
+        self._has_follow_up = False
+        self._is_executing = False
+        self._is_stopped = False
+
+        self._executed = 0
+        self._queued = 0
+        self._coalesced = 0
+        self._skipped = 0
+        self._cancelled = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def metrics(self) -> dict:
+        metrics = {
+            "executed": self._executed,
+            "queued": self._queued,
+            "coalesced": self._coalesced,
+            "skipped": self._skipped,
+            "cancelled": self._cancelled,
+        }
+
+        return metrics
+
+    def request(self) -> Optional[asyncio.Task]:
+        """Request an update, returns the task that will fulfill it."""
+        if self._is_stopped:
+            self._skipped += 1
+
+            _LOGGER.debug(f"Skip {self._name}, coordinator is stopped")
+
+            return None
+
+        if self.is_running:
+            if self._has_follow_up or not self._is_executing:
+                self._coalesced += 1
+            else:
+                self._has_follow_up = True
+                self._queued += 1
+
+            return self._task
+
+        self._task = self._hass.async_create_task(self._async_run())
+
+        return self._task
+
+    async def async_request(self):
+        """Request an update and wait until it is fulfilled."""
+        task = self.request()
+
+        if task is not None:
+            await asyncio.shield(task)
+
+    def skip(self):
+        self._skipped += 1
+
+    async def async_stop(self):
+        """Cancel in-flight update and reject further requests."""
+        self._is_stopped = True
+        self._has_follow_up = False
+
+        if self.is_running:
+            self._cancelled += 1
+
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                _LOGGER.debug(f"{self._name} cancelled")
+
+        self._task = None
+
+    async def _async_run(self):
+        while True:
+            self._has_follow_up = False
+            self._is_executing = True
+            self._executed += 1
+
+            try:
+                await self._action()
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(
+                    f"Failed to run {self._name}, Error: {ex}, Line: {line_number}"
+                )
+            finally:
+                self._is_executing = False
+
+            if not self._has_follow_up or self._is_stopped:
+                break
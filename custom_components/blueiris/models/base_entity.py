@@ -43,7 +43,9 @@ class BlueIrisEntity(Entity):
     integration_name: str = None
     entity: EntityData = None
     remove_dispatcher = None
+    remove_entity_dispatcher = None
     current_domain: str = None
+    last_published = None
 
     ha = None
     entity_manager = None
@@ -61,7 +63,9 @@ class BlueIrisEntity(Entity):
         self.integration_name = integration_name
         self.entity = entity
         self.remove_dispatcher = None
+        self.remove_entity_dispatcher = None
         self.current_domain = current_domain
+        self.last_published = None
 
         self.ha = get_ha(self.hass, self.integration_name)
         self.entity_manager = self.ha.entity_manager
@@ -94,10 +98,20 @@ class BlueIrisEntity(Entity):
 
     async def async_added_to_hass(self):
         """Register callbacks."""
-        async_dispatcher_connect(
+        self.remove_dispatcher = async_dispatcher_connect(
             self.hass, SIGNALS[self.current_domain], self._schedule_immediate_update
         )
 
+        entity_signal = self.entity_manager.get_entity_signal(
+            self.current_domain, self.unique_id
+        )
+
+        self.remove_entity_dispatcher = async_dispatcher_connect(
+            self.hass, entity_signal, self._schedule_immediate_update
+        )
+
+        self.last_published = self._get_published()
+
         await self.async_added_to_hass_local()
 
     async def async_will_remove_from_hass(self) -> None:
@@ -105,13 +119,15 @@ class BlueIrisEntity(Entity):
             self.remove_dispatcher()
             self.remove_dispatcher = None
 
+        if self.remove_entity_dispatcher is not None:
+            self.remove_entity_dispatcher()
+            self.remove_entity_dispatcher = None
+
         await self.async_will_remove_from_hass_local()
 
     @callback
     def _schedule_immediate_update(self):
-        self.hass.async_create_task(self._async_schedule_immediate_update())
-
-    async def _async_schedule_immediate_update(self):
+        """Apply the already computed EntityData, called in the event loop."""
         if self.entity_manager is None:
             _LOGGER.debug(
                 f"Cannot update {self.current_domain} - Entity Manager is None | {self.name}"
@@ -139,5 +155,27 @@ class BlueIrisEntity(Entity):
     async def async_will_remove_from_hass_local(self):
         pass
 
+    def _get_published(self):
+        """State and attributes compared to decide whether to write the state."""
+        excluded_attributes = self.ha.config_data.excluded_attributes
+        attributes = {
+            key: value
+            for key, value in (self.entity.attributes or {}).items()
+            if key not in excluded_attributes
+        }
+
+        published = (self.entity.state, attributes)
+
+        return published
+
     def _immediate_update(self, previous_state: bool):
-        self.async_schedule_update_ha_state(True)
+        published = self._get_published()
+
+        if published == self.last_published:
+            self.entity_manager.state_writes_skipped += 1
+            return
+
+        self.last_published = published
+        self.entity_manager.state_writes += 1
+
+        self.async_write_ha_state()
@@ -1,28 +1,79 @@
+from typing import Optional
+
 from ..helpers.const import *
 
 
 class CameraData:
+    __slots__ = (
+        "id",
+        "name",
+        "has_audio",
+        "is_online",
+        "is_group",
+        "is_system",
+        "group_cameras",
+        "type",
+        "fps",
+        "attribute_values",
+    )
+
     id: str
     name: str
     has_audio: bool
     is_online: bool
     is_group: bool
     is_system: bool
-    group_cameras: dict
+    group_cameras: Optional[list]
     type: str
-    data: dict
+    fps: int
+    attribute_values: tuple
 
     def __init__(self, camera):
         self.id = camera.get(BI_ATTR_ID)
         self.name = camera.get(BI_ATTR_NAME)
         self.is_online = camera.get(BI_ATTR_IS_ONLINE, False)
         self.has_audio = camera.get(BI_ATTR_AUDIO, False)
-        self.data = camera
         self.is_group = True if (camera.get(BI_ATTR_GROUP) is not None) else False
-        if self.is_group:
-            self.group_cameras = camera.get(BI_ATTR_GROUP)
+        self.group_cameras = camera.get(BI_ATTR_GROUP) if self.is_group else None
         self.is_system = self.id in SYSTEM_CAMERA_ID
         self.type = camera.get(BI_ATTR_TYPE)
+        self.fps = camera.get(BI_ATTR_FPS, 1)
+
+        # Keep only the values being used, ordered as CAMERA_ATTRIBUTE_NAMES
+        self.attribute_values = tuple(
+            camera.get(key, NOT_AVAILABLE) for key in CAMERA_ATTRIBUTE_KEYS
+        )
+
+    @property
+    def attributes(self) -> dict:
+        attributes = dict(zip(CAMERA_ATTRIBUTE_NAMES, self.attribute_values))
+
+        return attributes
+
+    def to_dict(self) -> dict:
+        """camlist item with the fields in use, CameraData can be created from it."""
+        obj = {
+            key: value
+            for key, value in zip(CAMERA_ATTRIBUTE_KEYS, self.attribute_values)
+            if value != NOT_AVAILABLE
+        }
+
+        obj[BI_ATTR_TYPE] = self.type
+
+        return obj
+
+    def __eq__(self, other):
+        if not isinstance(other, CameraData):
+            return NotImplemented
+
+        is_equal = all(
+            getattr(self, key) == getattr(other, key) for key in self.__slots__
+        )
+
+        return is_equal
+
+    def __hash__(self):
+        return hash((self.id, self.name, self.is_online, self.type))
 
     def __repr__(self):
         obj = {
@@ -32,7 +83,7 @@ class CameraData:
             CAMERA_IS_ONLINE: self.is_online,
             CAMERA_IS_SYSTEM: self.is_system,
             CAMERA_IS_GROUP: self.is_group,
-            CAMERA_DATA: self.data,
+            CAMERA_DATA: self.attributes,
             CAMERA_GROUP_CAMERAS: self.group_cameras,
             CAMERA_TYPE: self.type,
         }
@@ -22,6 +22,12 @@ class ConfigData:
     allowed_external_sensor: list
     stream_type: str
     support_stream: bool
+    mqtt_coalesce_window: int
+    min_scan_interval: int
+    max_scan_interval: int
+    image_cache_ttl: int
+    connection_limit: int
+    excluded_attributes: list
 
     def __init__(self):
         self.name = DEFAULT_NAME
@@ -34,6 +40,12 @@ class ConfigData:
         self.log_level = LOG_LEVEL_DEFAULT
         self.stream_type = DEFAULT_STREAM_TYPE
         self.support_stream = False
+        self.mqtt_coalesce_window = DEFAULT_MQTT_COALESCE_WINDOW
+        self.min_scan_interval = DEFAULT_MIN_SCAN_INTERVAL
+        self.max_scan_interval = DEFAULT_MAX_SCAN_INTERVAL
+        self.image_cache_ttl = DEFAULT_IMAGE_CACHE_TTL
+        self.connection_limit = DEFAULT_CONNECTION_LIMIT
+        self.excluded_attributes = []
 
         self.allowed_camera = []
         self.allowed_profile = []
@@ -78,6 +90,12 @@ class ConfigData:
             CONF_ALLOWED_EXTERNAL_SENSOR: self.allowed_external_sensor,
             CONF_STREAM_TYPE: self.stream_type,
             CONF_SUPPORT_STREAM: self.support_stream,
+            CONF_MQTT_COALESCE_WINDOW: self.mqtt_coalesce_window,
+            CONF_MIN_SCAN_INTERVAL: self.min_scan_interval,
+            CONF_MAX_SCAN_INTERVAL: self.max_scan_interval,
+            CONF_IMAGE_CACHE_TTL: self.image_cache_ttl,
+            CONF_CONNECTION_LIMIT: self.connection_limit,
+            CONF_EXCLUDED_ATTRIBUTES: self.excluded_attributes,
         }
 
         to_string = f"{obj}"
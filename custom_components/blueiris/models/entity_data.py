@@ -4,6 +4,23 @@ from ..helpers.const import *
 
 
 class EntityData:
+    __slots__ = (
+        "id",
+        "unique_id",
+        "name",
+        "state",
+        "attributes",
+        "icon",
+        "device_name",
+        "status",
+        "topic",
+        "event",
+        "binary_sensor_device_class",
+        "type",
+        "details",
+        "disabled",
+    )
+
     id: str
     unique_id: str
     name: str
@@ -35,6 +52,22 @@ class EntityData:
         self.details = {}
         self.disabled = False
 
+    def __eq__(self, other):
+        """Compare the published data, status and disabled are runtime flags."""
+        if not isinstance(other, EntityData):
+            return NotImplemented
+
+        is_equal = all(
+            getattr(self, key) == getattr(other, key)
+            for key in self.__slots__
+            if key not in ENTITY_RUNTIME_FIELDS
+        )
+
+        return is_equal
+
+    def __hash__(self):
+        return hash(self.unique_id)
+
     def __repr__(self):
         obj = {
             ENTITY_ID: self.id,
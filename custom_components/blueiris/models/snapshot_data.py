@@ -0,0 +1,46 @@
+from ..helpers.const import *
+from .camera_data import CameraData
+
+
+class SnapshotData:
+    """Last known server data, used to create entities before the first update."""
+
+    data: dict
+    status: dict
+    camera_list: list[CameraData]
+
+    def __init__(self):
+        self.data = {}
+        self.status = {}
+        self.camera_list = []
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.data) == 0 and len(self.camera_list) == 0
+
+    @staticmethod
+    def from_dict(obj: dict):
+        snapshot = SnapshotData()
+
+        if obj is not None:
+            snapshot.data = obj.get(SNAPSHOT_DATA, {})
+            snapshot.status = obj.get(SNAPSHOT_STATUS, {})
+
+            cameras = obj.get(SNAPSHOT_CAMERA_LIST, [])
+            snapshot.camera_list = [CameraData(camera) for camera in cameras]
+
+        return snapshot
+
+    def to_dict(self):
+        obj = {
+            SNAPSHOT_DATA: self.data,
+            SNAPSHOT_STATUS: self.status,
+            SNAPSHOT_CAMERA_LIST: [camera.to_dict() for camera in self.camera_list],
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
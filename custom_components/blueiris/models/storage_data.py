@@ -43,7 +43,7 @@ class StorageData:
         for integration_key in self.integrations:
             current_integration = self.integrations[integration_key]
             integration = {
-                "CONF_GENERATE_CONFIG_FILES": current_integration.generate_configuration_files
+                CONF_GENERATE_CONFIG_FILES: current_integration.generate_configuration_files
             }
 
             integrations[integration_key] = integration
@@ -77,14 +77,18 @@ class BlueIrisProfileAndScheduleSwitch(SwitchEntity, BlueIrisEntity):
     async def set_profile(self, profile_id):
         await self.api.set_profile(profile_id)
 
-        self.entity_manager.update()
+        self.ha.poll_scheduler.accelerate()
+
+        await self.entity_manager.async_update()
 
         await self.ha.dispatch_all()
 
     async def set_schedule(self, schedule_name):
         await self.api.set_schedule(schedule_name)
 
-        self.entity_manager.update()
+        self.ha.poll_scheduler.accelerate()
+
+        await self.entity_manager.async_update()
 
         await self.ha.dispatch_all()
 